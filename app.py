@@ -1,15 +1,34 @@
-from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify
+from flask import Flask, Request, render_template, request, redirect, url_for, session, flash, jsonify, make_response
+from flask.json.provider import DefaultJSONProvider
+from markupsafe import Markup
 from werkzeug.security import generate_password_hash, check_password_hash
-from werkzeug.utils import secure_filename
 import os
+import re
+import sys
 import json
-from datetime import datetime
+import logging
+import functools
+import heapq
+import math
+import threading
+import time
+from tempfile import SpooledTemporaryFile
+from collections import namedtuple
+from types import MappingProxyType
 from resume_processor import ResumeProcessor  # Import the ResumeProcessor class
 from hiring_companies_analyzer import HiringCompaniesAnalyzer  # Import the HiringCompaniesAnalyzer class
 
+logger = logging.getLogger(__name__)
+
 # Configure upload folder and allowed extensions
 UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf', 'docx'}
+# Matches a filename ending in one of the allowed extensions, case-insensitively
+ALLOWED_FILE_PATTERN = re.compile(
+    r'.*\.(?:' + '|'.join(map(re.escape, sorted(ALLOWED_EXTENSIONS))) + r')\Z', re.IGNORECASE | re.DOTALL
+)
+# Uploads up to this size are parsed into memory instead of a temp file
+UPLOAD_SPOOL_SIZE = 4 * 1024 * 1024
 
 # Create upload folder if it doesn't exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
@@ -17,23 +36,30 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 # Optional imports - will work without them for demo
 try:
     import mysql.connector
-    from mysql.connector import Error
+    from mysql.connector import Error, pooling
     MYSQL_AVAILABLE = True
 except ImportError:
     MYSQL_AVAILABLE = False
-    print("MySQL not available - using in-memory storage for demo")
+    logger.warning("MySQL not available - using in-memory storage for demo")
 # Force-disable MySQL via environment variable for free hosting
 if os.environ.get('DISABLE_MYSQL') == '1':
     MYSQL_AVAILABLE = False
-    print("MySQL disabled via DISABLE_MYSQL=1 - using in-memory storage")
+    logger.info("MySQL disabled via DISABLE_MYSQL=1 - using in-memory storage")
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHash, VerificationError
+    ARGON2_AVAILABLE = True
+except ImportError:
+    ARGON2_AVAILABLE = False
+    logger.warning("argon2-cffi not available - using Werkzeug password hashing")
+
 try:
-    import spacy
-    nlp = spacy.load("en_core_web_sm")
-    NLP_AVAILABLE = True
-except (ImportError, OSError):
-    NLP_AVAILABLE = False
-    nlp = None
-    print("spaCy not available - some features may be limited")
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available - using the standard json module")
 
 try:
     from sklearn.feature_extraction.text import TfidfVectorizer
@@ -41,15 +67,65 @@ try:
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
-    print("Scikit-learn not available - using basic matching")
+    logger.warning("Scikit-learn not available - using basic matching")
+
+class UploadRequest(Request):
+    """Request that keeps typical resume uploads in memory while parsing"""
+    # Plain (non-file) form fields never need more than this
+    max_form_memory_size = 500 * 1024
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Werkzeug spills anything over 500KB to disk; most resumes are a few MB
+        return SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE, mode='rb+')
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes and decodes with orjson"""
+    sort_keys = False
+
+    def dumps_bytes(self, obj, indent=False, sort_keys=None, option=0):
+        """Encode to UTF-8 JSON bytes"""
+        option |= orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if self.sort_keys if sort_keys is None else sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        # Types orjson can't encode natively (Decimal, Markup, ...) use Flask's default
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj, kwargs.get('indent'), kwargs.get('sort_keys')).decode()
+
+    def response(self, *args, **kwargs):
+        # Send orjson's bytes as the body instead of decoding to str and re-encoding
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = self.dumps_bytes(obj, indent, option=orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            # e.g. the session serializer's object_hook, which orjson doesn't support
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.request_class = UploadRequest
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
 app.secret_key = os.environ.get('SECRET_KEY', os.environ.get('FLASK_SECRET', 'dev-secret-change-me'))  # Change this to a secure secret key in production
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+# Static URLs carry a ?v=<mtime> version, so browsers/CDNs may cache them for a year
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+
+# Werkzeug hash method used without argon2, e.g. 'pbkdf2:sha256:120000'
+PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'pbkdf2')
+password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1) if ARGON2_AVAILABLE else None
 
 # In-memory storage for demo (replace with database in production)
-users_db = {}
+User = namedtuple('User', 'id username email password_hash')
+users_db = {}  # username -> User
+users_by_email = {}  # email -> User, keeps duplicate-email checks O(1)
 user_skills_db = {}
 user_counter = 1
 
@@ -68,22 +144,114 @@ DB_CONFIG = {
     'database': os.environ.get('MYSQL_DATABASE', 'career_pathfinder'),
 }
 
+# mysql-connector batches executemany() over this into one multi-row INSERT
+INSERT_USER_SKILL_SQL = (
+    "INSERT INTO user_skills (user_id, skill_name, skill_type, proficiency_level) "
+    "VALUES (%s, %s, %s, %s)"
+)
+
+# Upper bound on skills saved in one request, keeping the multi-row INSERT packet small
+MAX_SKILLS_PER_SAVE = 200
+
+def hash_password(password):
+    """Hash a password with argon2id, falling back to Werkzeug's KDF"""
+    if password_hasher:
+        return password_hasher.hash(password)
+    return generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+
+def verify_password(password_hash, password):
+    """Check a password against an argon2 or legacy Werkzeug hash"""
+    if password_hash.startswith('$argon2'):
+        if not password_hasher:
+            return False
+        try:
+            return password_hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHash):
+            return False
+    return check_password_hash(password_hash, password)
+
+def create_db_pool():
+    """Create a pool of pre-opened MySQL connections (None if unreachable)"""
+    default_size = max(8, (os.cpu_count() or 1) * 2)
+    pool_size = min(pooling.CNX_POOL_MAXSIZE, int(os.environ.get('MYSQL_POOL_SIZE', default_size)))
+    try:
+        return pooling.MySQLConnectionPool(pool_name='career_pathfinder', pool_size=pool_size, **DB_CONFIG)
+    except Error as e:
+        logger.error("Error creating MySQL connection pool: %s", e)
+        return None
+
+# One pool per process, created on first use: a pool opened before gunicorn
+# forks its workers (preload_app) would share the same sockets between them.
+# close() on a pooled connection returns it to the pool
+db_pool = None
+db_pool_pid = None
+db_pool_retry_at = 0.0
+db_pool_lock = threading.Lock()
+DB_POOL_RETRY_DELAY = 30  # seconds between attempts while MySQL is unreachable
+
+def get_db_pool():
+    """Return this process's connection pool, creating it on first use.
+
+    A failed attempt is retried after DB_POOL_RETRY_DELAY; until then callers
+    get None and fall back to one-off connections.
+    """
+    global db_pool, db_pool_pid, db_pool_retry_at
+    pid = os.getpid()
+    if db_pool_pid != pid and time.monotonic() >= db_pool_retry_at:
+        with db_pool_lock:
+            if db_pool_pid != pid and time.monotonic() >= db_pool_retry_at:
+                pool = create_db_pool()
+                if pool is None:
+                    db_pool_retry_at = time.monotonic() + DB_POOL_RETRY_DELAY
+                else:
+                    db_pool, db_pool_pid = pool, pid
+    return db_pool if db_pool_pid == pid else None
+
 def get_db_connection():
     """Get database connection"""
     if MYSQL_AVAILABLE:
         try:
+            pool = get_db_pool()
+            if pool:
+                try:
+                    return pool.get_connection()
+                except pooling.PoolError:
+                    pass  # Pool exhausted - fall back to a one-off connection
             connection = mysql.connector.connect(**DB_CONFIG)
             return connection
         except Error as e:
-            print(f"Error connecting to MySQL: {e}")
+            logger.error("Error connecting to MySQL: %s", e)
             return None
     return None
 
+# Columns of user_skills rows, in the order the in-memory store keeps them
+USER_SKILL_COLUMNS = ('skill_name', 'skill_type', 'proficiency_level')
+
+def fetch_user_skills(user_id, columns=('skill_name',)):
+    """Fetch the requested user_skills columns for a user as a list of tuples"""
+    indexes = [USER_SKILL_COLUMNS.index(column) for column in columns]  # Rejects unknown columns
+    if MYSQL_AVAILABLE:
+        connection = get_db_connection()
+        if not connection:
+            return []
+        cursor = connection.cursor()
+        try:
+            cursor.execute(f"SELECT {', '.join(columns)} FROM user_skills WHERE user_id = %s", (user_id,))
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+            connection.close()
+    # In-memory storage for demo
+    return [tuple(row[i] for i in indexes) for row in user_skills_db.get(user_id, [])]
+
 def init_database():
     """Initialize database and create tables"""
     if MYSQL_AVAILABLE:
-        connection = get_db_connection()
-        if connection:
+        # A one-off connection rather than get_db_connection(): this runs at
+        # import, in the gunicorn master, and must not leave a pool behind
+        # for the forked workers to inherit
+        connection = mysql.connector.connect(**DB_CONFIG)
+        try:
             cursor = connection.cursor()
 
             # Managed DBs (Railway) already have the database present.
@@ -111,16 +279,17 @@ def init_database():
 
             connection.commit()
             cursor.close()
+            logger.info("Database initialized successfully!")
+        finally:
             connection.close()
-            print("Database initialized successfully!")
     else:
-        print("Using in-memory storage for demo")
+        logger.info("Using in-memory storage for demo")
         
 # Initialize DB at import time (works under Gunicorn/Render)
 try:
     init_database()
-except Exception as e:
-    print(f"Database init error: {e}")
+except Exception:
+    logger.exception("Database init error")
     
 # Sample skills data with categories
 IT_SKILLS = {
@@ -204,9 +373,111 @@ NON_IT_SKILLS = {
     ]
 }
 
+# Intern catalog names so they share one object with JOB_REQUIREMENTS and form input;
+# multi-word literals such as 'Spring Boot' are not interned by the compiler
+IT_SKILLS = {sys.intern(category): [sys.intern(skill) for skill in skills] for category, skills in IT_SKILLS.items()}
+NON_IT_SKILLS = {sys.intern(category): [sys.intern(skill) for skill in skills] for category, skills in NON_IT_SKILLS.items()}
+
+# Flattened views of the skill catalogs, built once for O(1) lookups
+ALL_IT_SKILLS = frozenset(skill for skills in IT_SKILLS.values() for skill in skills)
+ALL_NON_IT_SKILLS = frozenset(skill for skills in NON_IT_SKILLS.values() for skill in skills)
+ALL_SKILLS = ALL_IT_SKILLS | ALL_NON_IT_SKILLS
+SKILL_TO_CATEGORY = {
+    skill: category
+    for catalog in (IT_SKILLS, NON_IT_SKILLS)
+    for category, skills in catalog.items()
+    for skill in skills
+}
+SKILL_TO_TYPE = {skill: 'IT' for skill in ALL_IT_SKILLS} | {skill: 'Non-IT' for skill in ALL_NON_IT_SKILLS}
+def skill_key(skill):
+    """Case- and whitespace-insensitive form of a skill name, used for matching"""
+    return sys.intern(' '.join(skill.split()).lower())
+
+# Case-insensitive lookup of the canonical skill name (e.g. 'mysql' -> 'MySQL')
+SKILL_LOOKUP = {skill_key(skill): skill for skill in ALL_SKILLS}
+
+HIGH_PRIORITY_SKILLS = frozenset({'Python', 'JavaScript', 'React', 'AWS'})
+
+@functools.lru_cache(maxsize=None)
+def static_file_version(filename):
+    """Modification time of a static file, used to bust long-lived caches"""
+    try:
+        return int(os.path.getmtime(os.path.join(app.static_folder, filename)))
+    except OSError:
+        return None
+
+@app.url_defaults
+def add_static_version(endpoint, values):
+    if endpoint == 'static' and 'filename' in values:
+        version = static_file_version(values['filename'])
+        if version:
+            values.setdefault('v', version)
+
+# Rendered HTML of marketing pages as seen by anonymous visitors
+static_page_cache = {}
+
+def render_static_page(template_name):
+    """Render a page that only varies by login state, reusing the anonymous render"""
+    # The layout shows the logged-in user and flashed messages, both kept in the session
+    if session:
+        return render_template(template_name)
+    if template_name not in static_page_cache:
+        static_page_cache[template_name] = render_template(template_name)
+    return static_page_cache[template_name]
+
+# Checkbox slots of _skill_picker.html, in render order
+SKILL_PICKER_SLOTS = (
+    [(skill, 'IT') for skills in IT_SKILLS.values() for skill in skills]
+    + [(skill, 'Non-IT') for skills in NON_IT_SKILLS.values() for skill in skills]
+)
+SKILL_PICKER_MARKER = Markup('<!--checked-->')
+skill_picker_segments = None
+
+def render_skill_picker(user_skills):
+    """Render the profile skill checkboxes, ticking the ones the user has
+
+    The picker only varies by which boxes are checked, so it is rendered once
+    with a marker at each checkbox and the user's state is spliced in.
+    """
+    global skill_picker_segments
+    if skill_picker_segments is None:
+        html = render_template('_skill_picker.html', it_skills=IT_SKILLS,
+                               non_it_skills=NON_IT_SKILLS, checked=SKILL_PICKER_MARKER)
+        segments = html.split(SKILL_PICKER_MARKER)
+        if len(segments) != len(SKILL_PICKER_SLOTS) + 1:
+            raise RuntimeError(
+                f"_skill_picker.html rendered {len(segments) - 1} checkbox markers, "
+                f"expected one per skill slot ({len(SKILL_PICKER_SLOTS)})"
+            )
+        skill_picker_segments = segments
+    selected = {(skill, skill_type) for skill, skill_type, _ in user_skills}
+    parts = [skill_picker_segments[0]]
+    for slot, segment in zip(SKILL_PICKER_SLOTS, skill_picker_segments[1:]):
+        if slot in selected:
+            parts.append('checked')
+        parts.append(segment)
+    return Markup(''.join(parts))
+
+def cache_control(max_age, public=True):
+    """Let browsers and proxies cache anonymous responses of a view"""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            # Checked before rendering, which consumes flashed messages;
+            # reading the session also makes Flask send 'Vary: Cookie'
+            anonymous = not session
+            response = make_response(view(*args, **kwargs))
+            if anonymous:
+                response.cache_control.max_age = max_age
+                response.cache_control.public = public
+            return response
+        return wrapper
+    return decorator
+
 @app.route('/')
+@cache_control(max_age=3600)
 def index():
-    return render_template('index.html')
+    return render_static_page('index.html')
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
@@ -221,12 +492,16 @@ def login():
         if MYSQL_AVAILABLE:
             connection = get_db_connection()
             if connection:
-                cursor = connection.cursor(dictionary=True)
-                cursor.execute("SELECT * FROM users WHERE username = %s", (username,))
-                user = cursor.fetchone()
-                connection.close()
+                # Hand the connection back before the slow hash check so other threads can use it
+                try:
+                    cursor = connection.cursor(dictionary=True)
+                    cursor.execute("SELECT id, username, password_hash FROM users WHERE username = %s", (username,))
+                    user = cursor.fetchone()
+                    cursor.close()
+                finally:
+                    connection.close()
                 
-                if user and check_password_hash(user['password_hash'], password):
+                if user and verify_password(user['password_hash'], password):
                     session['user_id'] = user['id']
                     session['username'] = user['username']
                     flash('Login successful!', 'success')
@@ -234,8 +509,8 @@ def login():
         else:
             # In-memory lookup keyed by username
             user = users_db.get(username)
-            if user and check_password_hash(user['password_hash'], password):
-                session['user_id'] = user['id']
+            if user and verify_password(user.password_hash, password):
+                session['user_id'] = user.id
                 session['username'] = username
                 flash('Login successful!', 'success')
                 return redirect(url_for('home'))
@@ -256,7 +531,7 @@ def register():
             flash('Passwords do not match!', 'error')
             return render_template('register.html')
         
-        password_hash = generate_password_hash(password)
+        password_hash = hash_password(password)
         
         if MYSQL_AVAILABLE:
             connection = get_db_connection()
@@ -279,13 +554,12 @@ def register():
             # In-memory storage for demo
             if username in users_db:
                 flash('Username already exists!', 'error')
+            elif email in users_by_email:
+                flash('Email already exists!', 'error')
             else:
-                users_db[username] = {
-                    'id': user_counter,
-                    'username': username,
-                    'email': email,
-                    'password_hash': password_hash
-                }
+                user = User(user_counter, username, email, password_hash)
+                users_db[username] = user
+                users_by_email[email] = user
                 user_counter += 1
                 flash('Registration successful! Please login.', 'success')
                 return redirect(url_for('login'))
@@ -299,12 +573,14 @@ def home():
     return render_template('home.html', username=session['username'])
 
 @app.route('/about')
+@cache_control(max_age=3600)
 def about():
-    return render_template('about.html')
+    return render_static_page('about.html')
 
 @app.route('/features')
+@cache_control(max_age=3600)
 def features():
-    return render_template('features.html')
+    return render_static_page('features.html')
 
 @app.route('/contact', methods=['GET', 'POST'])
 def contact():
@@ -329,34 +605,38 @@ def profile():
     
     if request.method == 'POST':
         if MYSQL_AVAILABLE:
-            # Clear existing skills
+            # Replace the user's skills in a single transaction
             connection = get_db_connection()
             if connection:
-                cursor = connection.cursor()
-                cursor.execute("DELETE FROM user_skills WHERE user_id = %s", (user_id,))
-                
-                # Add new skills
                 it_skills = request.form.getlist('it_skills')
                 non_it_skills = request.form.getlist('non_it_skills')
+                rows = [
+                    (user_id, skill, 'IT', request.form.get(f'proficiency_{skill}', 'Beginner'))
+                    for skill in it_skills
+                ] + [
+                    (user_id, skill, 'Non-IT', request.form.get(f'proficiency_{skill}', 'Beginner'))
+                    for skill in non_it_skills
+                ]
                 
-                for skill in it_skills:
-                    proficiency = request.form.get(f'proficiency_{skill}', 'Beginner')
-                    cursor.execute(
-                        "INSERT INTO user_skills (user_id, skill_name, skill_type, proficiency_level) VALUES (%s, %s, %s, %s)",
-                        (user_id, skill, 'IT', proficiency)
-                    )
-                
-                for skill in non_it_skills:
-                    proficiency = request.form.get(f'proficiency_{skill}', 'Beginner')
-                    cursor.execute(
-                        "INSERT INTO user_skills (user_id, skill_name, skill_type, proficiency_level) VALUES (%s, %s, %s, %s)",
-                        (user_id, skill, 'Non-IT', proficiency)
-                    )
-                
-                connection.commit()
-                cursor.close()
-                connection.close()
-                flash('Profile updated successfully!', 'success')
+                cursor = None
+                try:
+                    connection.start_transaction()
+                    cursor = connection.cursor()
+                    cursor.execute("DELETE FROM user_skills WHERE user_id = %s", (user_id,))
+                    if rows:
+                        cursor.executemany(INSERT_USER_SKILL_SQL, rows)
+                    
+                    connection.commit()
+                    flash('Profile updated successfully!', 'success')
+                except Exception:
+                    # Undo the DELETE so a failed update doesn't wipe the user's existing skills
+                    connection.rollback()
+                    logger.exception("Error updating profile skills")
+                    flash('Could not update your skills. Please try again.', 'error')
+                finally:
+                    if cursor is not None:
+                        cursor.close()
+                    connection.close()
                 return redirect(url_for('profile'))
                 
         else:
@@ -368,33 +648,21 @@ def profile():
             non_it_skills = request.form.getlist('non_it_skills')
             
             for skill in it_skills:
-                proficiency = request.form.get(f'proficiency_{skill}', 'Beginner')
-                user_skills_db[user_id].append((skill, 'IT', proficiency))
+                proficiency = sys.intern(request.form.get(f'proficiency_{skill}', 'Beginner'))
+                user_skills_db[user_id].append((sys.intern(skill), 'IT', proficiency))
             
             for skill in non_it_skills:
-                proficiency = request.form.get(f'proficiency_{skill}', 'Beginner')
-                user_skills_db[user_id].append((skill, 'Non-IT', proficiency))
+                proficiency = sys.intern(request.form.get(f'proficiency_{skill}', 'Beginner'))
+                user_skills_db[user_id].append((sys.intern(skill), 'Non-IT', proficiency))
             
             flash('Profile updated successfully!', 'success')
             return redirect(url_for('profile'))
     
     # Get current user skills
-    user_skills = []
-    if MYSQL_AVAILABLE:
-        connection = get_db_connection()
-        if connection:
-            cursor = connection.cursor()
-            cursor.execute("SELECT skill_name, skill_type, proficiency_level FROM user_skills WHERE user_id = %s", (user_id,))
-            user_skills = cursor.fetchall()
-            cursor.close()
-            connection.close()
-    else:
-        # In-memory storage for demo
-        user_skills = user_skills_db.get(user_id, [])
+    user_skills = fetch_user_skills(user_id, USER_SKILL_COLUMNS)
     
     return render_template('profile.html', 
-                         it_skills=IT_SKILLS, 
-                         non_it_skills=NON_IT_SKILLS, 
+                         skill_picker_html=render_skill_picker(user_skills), 
                          user_skills=user_skills)
 
 @app.route('/job_recommendations')
@@ -405,22 +673,10 @@ def job_recommendations():
     user_id = session['user_id']
     
     # Get user skills
-    user_skills = []
-    if MYSQL_AVAILABLE:
-        connection = get_db_connection()
-        if connection:
-            cursor = connection.cursor()
-            cursor.execute("SELECT skill_name FROM user_skills WHERE user_id = %s", (user_id,))
-            user_skills = [skill[0] for skill in cursor.fetchall()]
-            cursor.close()
-            connection.close()
-    else:
-        # In-memory storage for demo
-        user_skill_data = user_skills_db.get(user_id, [])
-        user_skills = [skill[0] for skill in user_skill_data]
+    user_skills = [row[0] for row in fetch_user_skills(user_id)]
     
-    # Generate job recommendations based on skills
-    recommendations = generate_job_recommendations(user_skills)
+    # Generate job recommendations based on skills (nothing can match without any)
+    recommendations = generate_job_recommendations(user_skills) if user_skills else []
     
     return render_template('job_recommendations.html', 
                          recommendations=recommendations, 
@@ -434,213 +690,74 @@ def skill_gap_analysis():
     user_id = session['user_id']
     
     # Get user skills
-    user_skills = []
-    if MYSQL_AVAILABLE:
-        connection = get_db_connection()
-        if connection:
-            cursor = connection.cursor()
-            cursor.execute("SELECT skill_name, proficiency_level FROM user_skills WHERE user_id = %s", (user_id,))
-            user_skills = {skill[0]: skill[1] for skill in cursor.fetchall()}
-            cursor.close()
-            connection.close()
-    else:
-        # In-memory storage for demo
-        user_skill_data = user_skills_db.get(user_id, [])
-        user_skills = {skill[0]: skill[2] for skill in user_skill_data}
+    user_skills = dict(fetch_user_skills(user_id, ('skill_name', 'proficiency_level')))
     
     # Get target job for analysis (default to first job if none selected)
     target_job = request.args.get('job', 'Python Developer')
     
-    # Generate skill gap analysis
-    gap_analysis = generate_skill_gap_analysis(user_skills, target_job)
+    # Generate skill gap analysis; users without skills get the precomputed all-missing report
+    if user_skills:
+        gap_analysis = generate_skill_gap_analysis(tuple(sorted(user_skills.items())), target_job)
+    else:
+        gap_analysis = EMPTY_GAP_ANALYSES.get(target_job) or generate_skill_gap_analysis((), target_job)
     
     return render_template('skill_gap_analysis.html', 
                          gap_analysis=gap_analysis,
                          target_job=target_job,
                          available_jobs=get_available_job_titles())
 
-def generate_skill_gap_analysis(user_skills, target_job):
-    """Generate comprehensive skill gap analysis"""
-    # Job requirements database (in real app, this would come from APIs)
-    job_requirements = {
-        'Python Developer': {
-            'required_skills': ['Python', 'Django', 'MySQL', 'Git', 'REST API'],
-            'preferred_skills': ['Docker', 'AWS', 'Redis', 'JavaScript'],
-            'experience_level': 'Mid-level'
-        },
-        'Full Stack Developer': {
-            'required_skills': ['JavaScript', 'React', 'Node.js', 'MongoDB', 'HTML5', 'CSS3'],
-            'preferred_skills': ['TypeScript', 'GraphQL', 'Docker', 'AWS'],
-            'experience_level': 'Mid-level'
-        },
-        'Data Scientist': {
-            'required_skills': ['Python', 'Machine Learning', 'Data Analysis', 'Pandas', 'NumPy'],
-            'preferred_skills': ['TensorFlow', 'Deep Learning', 'SQL', 'R'],
-            'experience_level': 'Senior'
-        },
-        'DevOps Engineer': {
-            'required_skills': ['AWS', 'Docker', 'Kubernetes', 'Linux', 'CI/CD'],
-            'preferred_skills': ['Terraform', 'Ansible', 'Jenkins', 'Python'],
-            'experience_level': 'Mid-level'
-        },
-        'Frontend Developer': {
-            'required_skills': ['JavaScript', 'React', 'HTML5', 'CSS3'],
-            'preferred_skills': ['Vue.js', 'TypeScript', 'Webpack', 'SASS'],
-            'experience_level': 'Entry-level'
-        },
-        'Backend Developer': {
-            'required_skills': ['Python', 'Node.js', 'MySQL', 'REST API', 'Git'],
-            'preferred_skills': ['Redis', 'MongoDB', 'Docker', 'Microservices'],
-            'experience_level': 'Mid-level'
-        },
-        'Mobile App Developer': {
-            'required_skills': ['Swift', 'Kotlin', 'React Native', 'Mobile Development'],
-            'preferred_skills': ['Flutter', 'Firebase', 'iOS', 'Android'],
-            'experience_level': 'Mid-level'
-        },
-        'Machine Learning Engineer': {
-            'required_skills': ['Python', 'Machine Learning', 'TensorFlow', 'Data Science', 'Deep Learning'],
-            'preferred_skills': ['PyTorch', 'MLOps', 'Kubernetes', 'AWS'],
-            'experience_level': 'Senior'
-        },
-        'Cloud Architect': {
-            'required_skills': ['AWS', 'Azure', 'Cloud Architecture', 'Kubernetes', 'Terraform'],
-            'preferred_skills': ['Google Cloud', 'Microservices', 'Security', 'DevOps'],
-            'experience_level': 'Senior'
-        },
-        'Cybersecurity Analyst': {
-            'required_skills': ['Cybersecurity', 'Network Security', 'Risk Assessment', 'Incident Response'],
-            'preferred_skills': ['Penetration Testing', 'SIEM', 'Compliance', 'Forensics'],
-            'experience_level': 'Mid-level'
-        },
-        'UI/UX Designer': {
-            'required_skills': ['UI/UX Design', 'Figma', 'User Research', 'Prototyping'],
-            'preferred_skills': ['Adobe XD', 'Sketch', 'User Testing', 'Design Systems'],
-            'experience_level': 'Mid-level'
-        },
-        'Product Manager': {
-            'required_skills': ['Product Management', 'Agile', 'User Research', 'Strategic Planning'],
-            'preferred_skills': ['Data Analysis', 'A/B Testing', 'Roadmapping', 'Stakeholder Management'],
-            'experience_level': 'Senior'
-        },
-        'QA Engineer': {
-            'required_skills': ['Testing', 'Automation Testing', 'Selenium', 'Bug Tracking'],
-            'preferred_skills': ['API Testing', 'Performance Testing', 'CI/CD', 'Python'],
-            'experience_level': 'Mid-level'
-        },
-        'Database Administrator': {
-            'required_skills': ['MySQL', 'PostgreSQL', 'Database Design', 'SQL', 'Backup & Recovery'],
-            'preferred_skills': ['MongoDB', 'Oracle', 'Performance Tuning', 'Cloud Databases'],
-            'experience_level': 'Mid-level'
-        },
-        'Software Architect': {
-            'required_skills': ['System Design', 'Microservices', 'Design Patterns', 'Architecture'],
-            'preferred_skills': ['Cloud Architecture', 'Scalability', 'Security', 'Performance'],
-            'experience_level': 'Senior'
-        },
-        'Game Developer': {
-            'required_skills': ['Unity', 'C#', 'Game Development', '3D Graphics'],
-            'preferred_skills': ['Unreal Engine', 'C++', 'Animation', 'Physics'],
-            'experience_level': 'Mid-level'
-        },
-        'Blockchain Developer': {
-            'required_skills': ['Blockchain', 'Solidity', 'Smart Contracts', 'Ethereum'],
-            'preferred_skills': ['Web3', 'DeFi', 'NFT', 'Cryptocurrency'],
-            'experience_level': 'Senior'
-        },
-        'AI Research Scientist': {
-            'required_skills': ['Deep Learning', 'Neural Networks', 'Research', 'Python', 'Mathematics'],
-            'preferred_skills': ['Computer Vision', 'NLP', 'Reinforcement Learning', 'Publications'],
-            'experience_level': 'Senior'
-        },
-        'Site Reliability Engineer': {
-            'required_skills': ['Linux', 'Monitoring', 'Automation', 'Incident Management', 'Scripting'],
-            'preferred_skills': ['Kubernetes', 'Prometheus', 'Grafana', 'Cloud Platforms'],
-            'experience_level': 'Senior'
-        },
-        'Business Analyst': {
-            'required_skills': ['Business Analysis', 'Requirements Gathering', 'Process Improvement', 'Documentation'],
-            'preferred_skills': ['SQL', 'Data Visualization', 'Project Management', 'Stakeholder Management'],
-            'experience_level': 'Mid-level'
-        },
-        'Java Developer': {
-            'required_skills': ['Java', 'Spring Boot', 'MySQL', 'Maven', 'Git'],
-            'preferred_skills': ['Spring Framework', 'Hibernate', 'REST API', 'JUnit'],
-            'experience_level': 'Mid-level'
-        },
-        'Java Full Stack Developer': {
-            'required_skills': ['Java', 'Spring Boot', 'JavaScript', 'React', 'MySQL'],
-            'preferred_skills': ['Angular', 'Microservices', 'Docker', 'AWS'],
-            'experience_level': 'Mid-level'
-        },
-        'Enterprise Java Developer': {
-            'required_skills': ['Java', 'Spring Framework', 'JPA', 'Enterprise Applications', 'Design Patterns'],
-            'preferred_skills': ['Spring Security', 'Apache Kafka', 'Redis', 'Microservices'],
-            'experience_level': 'Senior'
-        },
-        'Android Developer': {
-            'required_skills': ['Java', 'Kotlin', 'Android SDK', 'Mobile Development'],
-            'preferred_skills': ['Jetpack Compose', 'Firebase', 'Room Database', 'MVVM'],
-            'experience_level': 'Mid-level'
+# Job requirements database (in real app, this would come from APIs)
+JOB_REQUIREMENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'job_requirements.json')
+
+def load_job_requirements(path=JOB_REQUIREMENTS_FILE):
+    """Load job requirements, interning titles and skills so repeats share one object"""
+    with open(path, encoding='utf-8') as f:
+        jobs = json.load(f)
+    return {
+        sys.intern(title): {
+            'required_skills': [sys.intern(skill) for skill in req['required_skills']],
+            'preferred_skills': [sys.intern(skill) for skill in req['preferred_skills']],
+            'experience_level': sys.intern(req['experience_level'])
         }
+        for title, req in jobs.items()
     }
-    
-    job_req = job_requirements.get(target_job, job_requirements['Python Developer'])
+
+# Loaded once at import rather than rebuilt per call
+JOB_REQUIREMENTS = load_job_requirements()
+
+# Dropdown options for the gap analysis page, in file order
+AVAILABLE_JOBS = tuple(JOB_REQUIREMENTS)
+
+PROFICIENCY_SCORES = {'Beginner': 1, 'Intermediate': 2, 'Advanced': 3}
+
+@functools.lru_cache(maxsize=1024)
+def generate_skill_gap_analysis(user_skills_key, target_job):
+    """Generate comprehensive skill gap analysis
+
+    user_skills_key is a hashable tuple of (skill, proficiency) pairs so results
+    can be cached; the returned dict is shared and must not be mutated.
+    """
+    user_skills = dict(user_skills_key)
+    # Score each of the user's skills once instead of per job skill lookup
+    user_scores = {skill: PROFICIENCY_SCORES.get(proficiency, 0) for skill, proficiency in user_skills_key}
+    job_req = JOB_REQUIREMENTS.get(target_job, JOB_REQUIREMENTS['Python Developer'])
     
     # Calculate skill gaps
     required_skills = job_req['required_skills']
     preferred_skills = job_req['preferred_skills']
     
+    required_analysis, required_score = score_skills(required_skills, user_skills, user_scores)
+    preferred_analysis, preferred_score = score_skills(preferred_skills, user_skills, user_scores)
+    
     skill_analysis = {
         'target_job': target_job,
-        'required_skills_analysis': [],
-        'preferred_skills_analysis': [],
+        'required_skills_analysis': required_analysis,
+        'preferred_skills_analysis': preferred_analysis,
         'overall_readiness': 0,
-        'missing_skills': [],
+        'missing_skills': [row['skill'] for row in required_analysis if not row['user_proficiency']],
         'improvement_areas': []
     }
     
-    # Analyze required skills
-    required_score = 0
-    for skill in required_skills:
-        proficiency = user_skills.get(skill, None)
-        if proficiency:
-            score = get_proficiency_score(proficiency)
-            required_score += score
-            status = 'have' if score > 0 else 'missing'
-        else:
-            score = 0
-            status = 'missing'
-            skill_analysis['missing_skills'].append(skill)
-        
-        skill_analysis['required_skills_analysis'].append({
-            'skill': skill,
-            'user_proficiency': proficiency,
-            'score': score,
-            'status': status,
-            'progress_percentage': min(score * 33, 100)  # Convert to percentage
-        })
-    
-    # Analyze preferred skills
-    preferred_score = 0
-    for skill in preferred_skills:
-        proficiency = user_skills.get(skill, None)
-        if proficiency:
-            score = get_proficiency_score(proficiency)
-            preferred_score += score
-            status = 'have' if score > 0 else 'missing'
-        else:
-            score = 0
-            status = 'missing'
-        
-        skill_analysis['preferred_skills_analysis'].append({
-            'skill': skill,
-            'user_proficiency': proficiency,
-            'score': score,
-            'status': status,
-            'progress_percentage': min(score * 33, 100)
-        })
-    
     # Calculate overall readiness
     total_required = len(required_skills) * 3  # Max score per skill is 3
     total_preferred = len(preferred_skills) * 3
@@ -659,32 +776,47 @@ def generate_skill_gap_analysis(user_skills, target_job):
     
     return skill_analysis
 
-def get_proficiency_score(proficiency):
-    """Convert proficiency level to numeric score"""
-    proficiency_scores = {
-        'Beginner': 1,
-        'Intermediate': 2,
-        'Advanced': 3
-    }
-    return proficiency_scores.get(proficiency, 0)
+def score_skills(skills, user_skills, user_scores):
+    """Score each skill against the user's proficiency in a single pass
+
+    Returns the per-skill analysis rows and their total score.
+    """
+    rows = []
+    total = 0
+    for skill in skills:
+        proficiency = user_skills.get(skill)
+        score = user_scores.get(skill, 0)
+        total += score
+        rows.append({
+            'skill': skill,
+            'user_proficiency': proficiency,
+            'score': score,
+            'status': 'have' if score > 0 else 'missing',
+            'progress_percentage': min(score * 33, 100)  # Convert to percentage
+        })
+    return rows, total
 
 def get_available_job_titles():
     """Get list of available job titles for analysis"""
-    return ['Python Developer', 'Full Stack Developer', 'Data Scientist', 'DevOps Engineer', 'Frontend Developer', 'Backend Developer', 'Mobile App Developer', 'Machine Learning Engineer', 'Cloud Architect', 'Cybersecurity Analyst', 'UI/UX Designer', 'Product Manager', 'QA Engineer', 'Database Administrator', 'Software Architect', 'Game Developer', 'Blockchain Developer', 'AI Research Scientist', 'Site Reliability Engineer', 'Business Analyst', 'Java Developer', 'Java Full Stack Developer', 'Enterprise Java Developer', 'Android Developer']
+    return AVAILABLE_JOBS
+
+# Fields shared by every suggested course
+COURSE_BASE = {'provider': 'Coursera', 'duration': '4-6 weeks', 'level': 'Beginner to Intermediate'}
 
 def generate_improvement_suggestions(missing_skills):
     """Generate learning suggestions for missing skills"""
-    suggestions = []
-    for skill in missing_skills[:5]:  # Limit to top 5 suggestions
-        suggestions.append({
+    return [
+        {
             'skill': skill,
             'course': f"Complete {skill} Course",
-            'provider': 'Coursera',
-            'duration': '4-6 weeks',
-            'level': 'Beginner to Intermediate',
-            'priority': 'High' if skill in ['Python', 'JavaScript', 'React', 'AWS'] else 'Medium'
-        })
-    return suggestions
+            **COURSE_BASE,
+            'priority': 'High' if skill in HIGH_PRIORITY_SKILLS else 'Medium'
+        }
+        for skill in missing_skills[:5]  # Limit to top 5 suggestions
+    ]
+
+# Gap analyses for a user with no skills yet, built once per job outside the LRU cache
+EMPTY_GAP_ANALYSES = {title: generate_skill_gap_analysis.__wrapped__((), title) for title in JOB_REQUIREMENTS}
 
 @app.route('/logout')
 def logout():
@@ -703,153 +835,209 @@ def save_skills():
     if 'user_id' not in session:
         return jsonify({'status': 'error', 'message': 'Not logged in'}), 401
     
-    data = request.get_json()
-    if not data or 'skills' not in data:
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or 'skills' not in data:
         return jsonify({'status': 'error', 'message': 'No skills provided'}), 400
+    # The body comes from the client, so check its shape before touching the names
+    if not isinstance(data['skills'], list) or not all(isinstance(skill, str) for skill in data['skills']):
+        return jsonify({'status': 'error', 'message': 'Skills must be a list of strings'}), 400
     
     user_id = session['user_id']
-    skills = data['skills']
+    # Map extracted names onto the catalog spelling (e.g. 'Mysql' -> 'MySQL'),
+    # dropping blank entries and repeats before the size check
+    names = (SKILL_LOOKUP.get(skill_key(skill), skill.strip()) for skill in data['skills'])
+    skills = list(dict.fromkeys(name for name in names if name))
+    if len(skills) > MAX_SKILLS_PER_SAVE:
+        return jsonify({'status': 'error', 'message': f'Too many skills (max {MAX_SKILLS_PER_SAVE})'}), 400
     
     if MYSQL_AVAILABLE:
+        connection = get_db_connection()
+        if not connection:
+            return jsonify({'status': 'error', 'message': 'Database error'}), 500
+        # Unknown skills default to IT type and Intermediate proficiency
+        rows = [(user_id, skill, SKILL_TO_TYPE.get(skill, 'IT'), 'Intermediate') for skill in skills]
+        
+        cursor = None
         try:
-            connection = get_db_connection()
-            if connection:
-                cursor = connection.cursor()
-                # Clear existing skills
-                cursor.execute("DELETE FROM user_skills WHERE user_id = %s", (user_id,))
-                
-                # Add new skills
-                for skill in skills:
-                    cursor.execute(
-                        """
-                        INSERT INTO user_skills (user_id, skill_name, skill_type, proficiency_level)
-                        VALUES (%s, %s, %s, %s)
-                        """,
-                        (user_id, skill, 'IT', 'Intermediate')  # Default to IT type and Intermediate proficiency
-                    )
-                
-                connection.commit()
-                cursor.close()
-                connection.close()
-                return jsonify({'status': 'success', 'message': 'Skills saved successfully'})
-                
-        except Exception as e:
-            print(f"Error saving skills: {e}")
+            # Clear existing skills and add the new ones in one transaction;
+            # executemany sends the rows as a single multi-row INSERT statement
+            connection.start_transaction()
+            cursor = connection.cursor()
+            cursor.execute("DELETE FROM user_skills WHERE user_id = %s", (user_id,))
+            if rows:
+                cursor.executemany(INSERT_USER_SKILL_SQL, rows)
+            
+            connection.commit()
+            return jsonify({'status': 'success', 'message': 'Skills saved successfully'})
+            
+        except Exception:
+            logger.exception("Error saving skills")
+            # Undo the DELETE so a failed save doesn't wipe the user's existing skills;
+            # on a dropped connection the rollback fails too and the server discards it
+            try:
+                connection.rollback()
+            except Error:
+                logger.warning("Rollback failed after a skills save error")
             return jsonify({'status': 'error', 'message': 'Database error'}), 500
+        finally:
+            if cursor is not None:
+                cursor.close()
+            connection.close()
     else:
         # In-memory storage for demo
-        user_skills_db[user_id] = [(skill, 'IT', 'Intermediate') for skill in skills]
+        user_skills_db[user_id] = [(skill, SKILL_TO_TYPE.get(skill, 'IT'), 'Intermediate') for skill in skills]
         return jsonify({'status': 'success', 'message': 'Skills saved successfully'})
 
-def generate_job_recommendations(user_skills):
-    """Generate job recommendations based on user skills"""
-    # Sample job data (in real implementation, this would come from APIs)
-    job_database = [
-        {
-            'title': 'Python Developer',
-            'company': 'Tech Corp',
-            'location': 'Remote',
-            'skills': ['Python', 'Django', 'MySQL', 'Git'],
-            'experience': 'Mid-level',
-            'salary': '$70,000 - $90,000'
-        },
-        {
-            'title': 'Full Stack Developer',
-            'company': 'StartupXYZ',
-            'location': 'New York',
-            'skills': ['JavaScript', 'React', 'Node.js', 'MongoDB'],
-            'experience': 'Mid-level',
-            'salary': '$80,000 - $100,000'
-        },
-        {
-            'title': 'Data Scientist',
-            'company': 'Data Analytics Inc',
-            'location': 'San Francisco',
-            'skills': ['Python', 'Machine Learning', 'Data Science'],
-            'experience': 'Senior',
-            'salary': '$100,000 - $130,000'
-        },
-        {
-            'title': 'DevOps Engineer',
-            'company': 'Cloud Solutions',
-            'location': 'Remote',
-            'skills': ['AWS', 'Docker', 'Kubernetes', 'Linux'],
-            'experience': 'Mid-level',
-            'salary': '$85,000 - $110,000'
-        },
-        {
-            'title': 'Frontend Developer',
-            'company': 'Design Studio',
-            'location': 'Los Angeles',
-            'skills': ['JavaScript', 'React', 'HTML5', 'CSS3'],
-            'experience': 'Entry-level',
-            'salary': '$60,000 - $80,000'
-        },
-        {
-            'title': 'Java Developer',
-            'company': 'Tech Corp',
-            'location': 'Remote',
-            'skills': ['Java', 'Spring Boot', 'MySQL', 'Maven', 'Git'],
-            'experience': 'Mid-level',
-            'salary': '$70,000 - $90,000'
-        },
-        {
-            'title': 'Java Full Stack Developer',
-            'company': 'StartupXYZ',
-            'location': 'New York',
-            'skills': ['Java', 'Spring Boot', 'JavaScript', 'React', 'MySQL'],
-            'experience': 'Mid-level',
-            'salary': '$80,000 - $100,000'
-        },
-        {
-            'title': 'Enterprise Java Developer',
-            'company': 'Data Analytics Inc',
-            'location': 'San Francisco',
-            'skills': ['Java', 'Spring Framework', 'JPA', 'Enterprise Applications', 'Design Patterns'],
-            'experience': 'Senior',
-            'salary': '$100,000 - $130,000'
-        },
-        {
-            'title': 'Android Developer',
-            'company': 'Cloud Solutions',
-            'location': 'Remote',
-            'skills': ['Java', 'Kotlin', 'Android SDK', 'Mobile Development'],
-            'experience': 'Mid-level',
-            'salary': '$85,000 - $110,000'
-        }
-    ]
+# Sample job data (in real implementation, this would come from APIs)
+JOB_DATABASE = [
+    {
+        'title': 'Python Developer',
+        'company': 'Tech Corp',
+        'location': 'Remote',
+        'skills': ['Python', 'Django', 'MySQL', 'Git'],
+        'experience': 'Mid-level',
+        'salary': '$70,000 - $90,000'
+    },
+    {
+        'title': 'Full Stack Developer',
+        'company': 'StartupXYZ',
+        'location': 'New York',
+        'skills': ['JavaScript', 'React', 'Node.js', 'MongoDB'],
+        'experience': 'Mid-level',
+        'salary': '$80,000 - $100,000'
+    },
+    {
+        'title': 'Data Scientist',
+        'company': 'Data Analytics Inc',
+        'location': 'San Francisco',
+        'skills': ['Python', 'Machine Learning', 'Data Science'],
+        'experience': 'Senior',
+        'salary': '$100,000 - $130,000'
+    },
+    {
+        'title': 'DevOps Engineer',
+        'company': 'Cloud Solutions',
+        'location': 'Remote',
+        'skills': ['AWS', 'Docker', 'Kubernetes', 'Linux'],
+        'experience': 'Mid-level',
+        'salary': '$85,000 - $110,000'
+    },
+    {
+        'title': 'Frontend Developer',
+        'company': 'Design Studio',
+        'location': 'Los Angeles',
+        'skills': ['JavaScript', 'React', 'HTML5', 'CSS3'],
+        'experience': 'Entry-level',
+        'salary': '$60,000 - $80,000'
+    },
+    {
+        'title': 'Java Developer',
+        'company': 'Tech Corp',
+        'location': 'Remote',
+        'skills': ['Java', 'Spring Boot', 'MySQL', 'Maven', 'Git'],
+        'experience': 'Mid-level',
+        'salary': '$70,000 - $90,000'
+    },
+    {
+        'title': 'Java Full Stack Developer',
+        'company': 'StartupXYZ',
+        'location': 'New York',
+        'skills': ['Java', 'Spring Boot', 'JavaScript', 'React', 'MySQL'],
+        'experience': 'Mid-level',
+        'salary': '$80,000 - $100,000'
+    },
+    {
+        'title': 'Enterprise Java Developer',
+        'company': 'Data Analytics Inc',
+        'location': 'San Francisco',
+        'skills': ['Java', 'Spring Framework', 'JPA', 'Enterprise Applications', 'Design Patterns'],
+        'experience': 'Senior',
+        'salary': '$100,000 - $130,000'
+    },
+    {
+        'title': 'Android Developer',
+        'company': 'Cloud Solutions',
+        'location': 'Remote',
+        'skills': ['Java', 'Kotlin', 'Android SDK', 'Mobile Development'],
+        'experience': 'Mid-level',
+        'salary': '$85,000 - $110,000'
+    }
+]
+
+# Read-only views: results are built as new dicts, so the shared job data can't be mutated
+JOB_DATABASE = tuple(MappingProxyType({**job, 'skills': tuple(job['skills'])}) for job in JOB_DATABASE)
+
+# Each job's skills as an int bitmask over the skill vocabulary of JOB_DATABASE
+JOB_SKILL_VOCAB = sorted({skill for job in JOB_DATABASE for skill in job['skills']})
+# Keyed by skill_key() so 'python' or 'Node.JS ' match the catalog spelling
+JOB_SKILL_BITS = {skill_key(skill): 1 << i for i, skill in enumerate(JOB_SKILL_VOCAB)}
+JOB_MASKS = [sum({JOB_SKILL_BITS[skill_key(skill)] for skill in job['skills']}) for job in JOB_DATABASE]
+
+# RCA-style skill weights: skills few jobs ask for count for more than ubiquitous ones.
+# log1p keeps a skill that every job lists at a small positive weight
+JOB_SKILL_WEIGHTS = [
+    math.log1p(len(JOB_DATABASE) / sum(1 for mask in JOB_MASKS if mask & bit))
+    for bit in JOB_SKILL_BITS.values()
+]
+
+def bit_indexes(mask):
+    """Yield the indexes of the bits set in a bitmask, lowest first"""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+def mask_weight(mask):
+    """Total RCA weight of the skills in a bitmask"""
+    return sum(JOB_SKILL_WEIGHTS[i] for i in bit_indexes(mask))
+
+JOB_WEIGHT_TOTALS = [mask_weight(mask) for mask in JOB_MASKS]
+
+# Inverted index: skill bit -> bitmask of the jobs (by JOB_DATABASE row) listing it
+JOBS_BY_SKILL = {
+    bit: sum(1 << row for row, mask in enumerate(JOB_MASKS) if mask & bit)
+    for bit in JOB_SKILL_BITS.values()
+}
+
+def generate_job_recommendations(user_skills, top_k=10):
+    """Generate the top_k job recommendations based on user skills"""
+    user_mask = 0
+    for skill in user_skills:
+        user_mask |= JOB_SKILL_BITS.get(skill_key(skill), 0)
+    return rank_jobs(user_mask, top_k)
+
+@functools.lru_cache(maxsize=4096)
+def rank_jobs(user_mask, top_k=10):
+    """Score the jobs sharing skills with a user's skill bitmask and return the best top_k
+
+    The mask is a canonical key for the user's known skills, so users with the
+    same skills share one cached result; it must not be mutated.
+    """
+    # Only jobs listing at least one of the user's skills need scoring
+    candidates = 0
+    for skill_index in bit_indexes(user_mask):
+        candidates |= JOBS_BY_SKILL[1 << skill_index]
     
     # Calculate similarity scores
-    recommendations = []
-    for job in job_database:
-        skill_match = len(set(user_skills) & set(job['skills']))
-        if skill_match > 0:
-            similarity_score = skill_match / len(job['skills'])
-            job['match_score'] = round(similarity_score * 100, 1)
-            job['matching_skills'] = list(set(user_skills) & set(job['skills']))
-            recommendations.append(job)
+    scored = []
+    for row in bit_indexes(candidates):
+        matching = list(bit_indexes(user_mask & JOB_MASKS[row]))
+        score = round(sum(JOB_SKILL_WEIGHTS[i] for i in matching) / JOB_WEIGHT_TOTALS[row] * 100, 1)
+        scored.append((score, row, matching))
     
-    # Sort by match score
-    recommendations.sort(key=lambda x: x['match_score'], reverse=True)
-    
-    return recommendations
+    # Keep the best matches (ties stay in database order); only they are built into dicts
+    top = heapq.nlargest(top_k, scored, key=lambda x: x[0])
+    return tuple(
+        {**JOB_DATABASE[row], 'match_score': score, 'matching_skills': [JOB_SKILL_VOCAB[i] for i in matching]}
+        for score, row, matching in top
+    )
 
 def get_upskill_suggestions(missing_skills):
     """Get upskilling course suggestions"""
-    course_suggestions = []
-    for skill in missing_skills:
-        course_suggestions.append({
-            'skill': skill,
-            'course': f"Complete {skill} Course",
-            'provider': 'Coursera',
-            'duration': '4-6 weeks',
-            'level': 'Beginner to Intermediate'
-        })
-    
-    return course_suggestions
+    return [{'skill': skill, 'course': f"Complete {skill} Course", **COURSE_BASE} for skill in missing_skills]
 
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return ALLOWED_FILE_PATTERN.match(filename) is not None
 
 @app.route('/api/upload-resume', methods=['POST'])
 def upload_resume():
@@ -869,24 +1057,14 @@ def upload_resume():
     
     if file and allowed_file(file.filename):
         try:
-            # Secure the filename and save to upload folder
-            filename = secure_filename(file.filename)
-            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(filepath)
-            
-            # Process the resume
-            result = resume_processor.process_resume(filepath)
-            
-            # Clean up the saved file after processing
-            try:
-                os.remove(filepath)
-            except Exception as e:
-                print(f"Warning: Could not delete temporary file {filepath}: {e}")
+            # Process the resume straight from the spooled upload stream; nothing is saved
+            file_ext = os.path.splitext(file.filename)[1]
+            result = resume_processor.process_resume_stream(file.stream, file_ext)
             
             return jsonify(result)
             
         except Exception as e:
-            print(f"Error processing resume: {e}")
+            logger.exception("Error processing resume")
             return jsonify({
                 'status': 'error',
                 'message': f'Error processing file: {str(e)}'
@@ -903,18 +1081,61 @@ def hiring_companies():
         return redirect(url_for('login'))
     return render_template('hiring_companies.html')
 
+# Hiring company analyses keyed by (keywords, location); a fresh one scrapes several sites
+HIRING_CACHE_TTL = 600  # seconds
+HIRING_CACHE_MAXSIZE = 512
+hiring_cache = {}
+hiring_cache_lock = threading.Lock()
+
+# Job boards only read upper-case boolean operators, so these survive lowercasing
+SEARCH_OPERATOR_PATTERN = re.compile(r'\b(?:and|or|not)\b')
+
+def normalize_search_term(term):
+    """Lowercase and collapse whitespace in a search term, keeping boolean operators"""
+    return SEARCH_OPERATOR_PATTERN.sub(lambda m: m.group().upper(), ' '.join(term.split()).lower())
+
+def analyze_hiring_companies_cached(keywords, location):
+    """Analyze hiring companies, reusing a result for the same query from the last 10 minutes"""
+    # Scrape with the normalized query too, so the per-board scrape cache
+    # shares entries between spellings just like this one does
+    keywords, location = normalize_search_term(keywords), normalize_search_term(location)
+    key = (keywords, location)
+    with hiring_cache_lock:
+        entry = hiring_cache.get(key)
+        if entry and time.monotonic() - entry[0] < HIRING_CACHE_TTL:
+            return entry[1]
+    
+    # Scrape outside the lock so other queries aren't held up
+    results = hiring_companies_analyzer.analyze_hiring_companies(keywords, location)
+    
+    with hiring_cache_lock:
+        now = time.monotonic()
+        if len(hiring_cache) >= HIRING_CACHE_MAXSIZE:
+            for stale_key in [k for k, (stored, _) in hiring_cache.items() if now - stored >= HIRING_CACHE_TTL]:
+                del hiring_cache[stale_key]
+            if len(hiring_cache) >= HIRING_CACHE_MAXSIZE:
+                del hiring_cache[next(iter(hiring_cache))]  # Oldest insertion
+        hiring_cache.pop(key, None)  # Re-insert at the end so iteration order stays by age
+        hiring_cache[key] = (now, results)
+    return results
+
 @app.route('/api/analyze_hiring_companies', methods=['POST'])
 def api_analyze_hiring_companies():
     if 'user_id' not in session:
         return jsonify({'error': 'Unauthorized'}), 401
     
+    data = request.get_json(silent=True)
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        return jsonify({'success': False, 'error': 'Expected a JSON object'}), 400
+    keywords = data.get('keywords', 'developer OR engineer OR analyst OR manager OR designer OR consultant OR specialist')
+    location = data.get('location', 'India')
+    if not isinstance(keywords, str) or not isinstance(location, str):
+        return jsonify({'success': False, 'error': 'Keywords and location must be strings'}), 400
+    
     try:
-        data = request.get_json()
-        keywords = data.get('keywords', 'developer OR engineer OR analyst OR manager OR designer OR consultant OR specialist')
-        location = data.get('location', 'India')
-        
-        analyzer = hiring_companies_analyzer
-        results = analyzer.analyze_hiring_companies(keywords, location)
+        results = analyze_hiring_companies_cached(keywords, location)
         
         return jsonify({
             'success': True,
@@ -927,14 +1148,6 @@ def api_analyze_hiring_companies():
             'error': str(e)
         }), 500
 
-def format_date(date_str):
-    if not date_str:
-        return None
-    try:
-        return datetime.strptime(date_str, '%Y-%m-%d')
-    except ValueError:
-        return None
-
 if __name__ == '__main__':
     init_database()
     app.run(debug=True)
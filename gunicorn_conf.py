@@ -0,0 +1,20 @@
+# Gunicorn configuration: gunicorn -c gunicorn_conf.py app:app
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Pre-forking workers; each also runs a few threads so requests waiting on MySQL
+# (recommendations, gap analysis, saving skills) don't block the worker
+workers = int(os.environ.get('WEB_CONCURRENCY', (os.cpu_count() or 1) * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', '4'))
+
+# A worker never uses more connections than it has threads; sizing each
+# worker's pool to match keeps workers * pool_size under MySQL's max_connections
+os.environ.setdefault('MYSQL_POOL_SIZE', str(threads))
+
+# Import app.py once in the master so the skill catalogs and job requirements
+# are shared copy-on-write by the forked workers instead of rebuilt per worker
+preload_app = True
+
+timeout = 60
@@ -1,21 +1,179 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+import atexit
+import multiprocessing
+import os
+import threading
 import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import json
 from datetime import datetime, timedelta
 import re
-from urllib.parse import urljoin, quote_plus
+from urllib.parse import quote_plus, urlsplit
 import logging
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 import random
-from collections import defaultdict
+from collections import Counter, defaultdict
+from job_page_parsers import parse_linkedin_page, parse_indeed_page, parse_glassdoor_page, parse_monster_page
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.info("orjson not available - saving results with the standard json module")
+
+try:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+    logger.info("Scikit-learn not available - removing only exact duplicate postings")
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+    logger.info("diskcache not available - caching scrape results in memory")
+
+# Boards are searched for the past day, so a board's results are reused within the hour
+SCRAPE_CACHE_TTL = 3600
+SCRAPE_CACHE_DIR = os.environ.get(
+    'HIRING_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.hiring_cache')
+)
+SCRAPE_CACHE_SIZE_LIMIT = 2 ** 28
+
+# Postings of one company whose title and location are at least this similar are the same job
+DUPLICATE_SIMILARITY = 0.95
+
+# Glassdoor search filters besides the keywords; the same for every search
+GLASSDOOR_SEARCH_PARAMS = {
+    'locT': 'C',
+    'locId': '1',
+    'jobType': '',
+    'fromAge': 1,
+    'minSalary': 0,
+    'includeNoSalaryJobs': 'true',
+    'radius': 25,
+    'cityId': -1,
+    'minRating': 0.0,
+    'industryId': -1,
+    'sgocId': -1,
+    'seniorityType': '',
+    'companyId': -1,
+    'employerSizes': '',
+    'applicationType': '',
+    'remoteWorkType': 0
+}
+
+# Result pages are parsed in this many worker processes (see job_page_parsers)
+PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+# Role categories matched against lowercased job titles, in priority order
+ROLE_CATEGORIES = (
+    ("engineer", "Software Engineer"),
+    ("developer", "Developer"),
+    ("manager", "Manager"),
+    ("analyst", "Analyst"),
+)
+
+URGENCY_PATTERN = re.compile(r'urgent|immediate|asap')  # Searched in lowercased titles
+VERY_RECENT_PATTERN = re.compile(r'today|1 day', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=4096)
+def classify_title(title_lc: str) -> Optional[str]:
+    """Common role category of a lowercased job title, or None when it fits none of them"""
+    for keyword, role in ROLE_CATEGORIES:
+        if keyword in title_lc:
+            return role
+    return None
+
+# Outbound request limits for a scraping run, so concurrent fetches don't trip rate limits
+MAX_CONCURRENT_REQUESTS = 20
+MAX_REQUESTS_PER_HOST = 4
+FETCH_ATTEMPTS = 3
+
+class ThrottledFetcher:
+    """Wraps an aiohttp session, capping concurrent requests overall and per host"""
+    
+    def __init__(self, session: aiohttp.ClientSession):
+        self.session = session
+        self.semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        self.host_semaphores = defaultdict(lambda: asyncio.Semaphore(MAX_REQUESTS_PER_HOST))
+    
+    async def fetch(self, url: str, params: Optional[Dict] = None) -> bytes:
+        """GET a results page, retrying transient failures with exponential backoff"""
+        host_semaphore = self.host_semaphores[urlsplit(url).hostname]
+        for attempt in range(FETCH_ATTEMPTS):
+            try:
+                async with self.semaphore, host_semaphore:
+                    async with self.session.get(url, params=params) as response:
+                        response.raise_for_status()
+                        return await response.read()
+            except aiohttp.ClientResponseError as e:
+                # Only throttling and server errors are worth another try
+                if (e.status != 429 and e.status < 500) or attempt == FETCH_ATTEMPTS - 1:
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == FETCH_ATTEMPTS - 1:
+                    raise
+            await asyncio.sleep(2 ** attempt + random.random())
+
+class ScrapeCache:
+    """Recent scrape results, on disk with diskcache or else in this process's memory"""
+    
+    def __init__(self):
+        self._disk = None
+        self.memory = {}
+        self.lock = threading.Lock()
+    
+    def disk(self):
+        """The diskcache store (None without diskcache), opened on first use so building one touches no files"""
+        if DISKCACHE_AVAILABLE and self._disk is None:
+            with self.lock:
+                if self._disk is None:
+                    self._disk = diskcache.Cache(SCRAPE_CACHE_DIR, size_limit=SCRAPE_CACHE_SIZE_LIMIT)
+        return self._disk
+    
+    def get(self, key: tuple):
+        """Cached value for a key, or None"""
+        disk = self.disk()
+        if disk is not None:
+            return disk.get(key)
+        with self.lock:
+            return self.memory.get(key)
+    
+    def set(self, key: tuple, value):
+        """Cache a value for the rest of the hour its key names"""
+        disk = self.disk()
+        if disk is not None:
+            disk.set(key, value, expire=SCRAPE_CACHE_TTL)
+            return
+        with self.lock:
+            # Keys end with their hour, so entries from earlier hours can never be hit again
+            self.memory = {k: v for k, v in self.memory.items() if k[-1] == key[-1]}
+            self.memory[key] = value
+    
+    def clear(self):
+        """Drop every cached value"""
+        disk = self.disk()
+        if disk is not None:
+            disk.clear()
+        with self.lock:
+            self.memory.clear()
+
+@dataclass(slots=True, frozen=True)
 class JobPosting:
     """Data class for job posting information"""
     company: str
@@ -28,8 +186,13 @@ class JobPosting:
     salary: Optional[str] = None
     job_type: Optional[str] = None
     experience_level: Optional[str] = None
+    title_lc: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Lowercased once here rather than in every title check
+        object.__setattr__(self, 'title_lc', self.title.lower())
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HiringInsight:
     """Data class for hiring insights"""
     company: str
@@ -44,16 +207,73 @@ class HiringInsight:
 class HiringCompaniesAnalyzer:
     """Analyzes job postings to identify currently hiring companies with real-time insights"""
     
+    __slots__ = ('headers', 'timeout', 'job_postings', 'hiring_insights', 'parse_pool', 'parse_pool_pid', 'parse_pool_lock', 'scrape_cache')
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        }
+        self.timeout = aiohttp.ClientTimeout(total=10)
         self.job_postings = []
         self.hiring_insights = {}
-        
-    def scrape_linkedin_jobs(self, keywords: str = "developer OR engineer OR analyst OR manager OR designer OR consultant OR specialist ", location: str = "India", max_pages: int = 2) -> List[JobPosting]:
+        self.parse_pool = None
+        self.parse_pool_pid = None
+        self.parse_pool_lock = threading.Lock()
+        self.scrape_cache = ScrapeCache()
+        
+    def get_parse_pool(self) -> ProcessPoolExecutor:
+        """Worker processes for page parsing, started on first use in each process"""
+        with self.parse_pool_lock:
+            # A pool inherited through fork (e.g. gunicorn's preload_app) belongs to the parent
+            if self.parse_pool is None or self.parse_pool_pid != os.getpid():
+                self.parse_pool = ProcessPoolExecutor(
+                    max_workers=PARSE_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+                self.parse_pool_pid = os.getpid()
+                # Stop the workers when this process exits; re-registering keeps a single entry
+                atexit.unregister(self.close)
+                atexit.register(self.close)
+            return self.parse_pool
+    
+    async def parse_page(self, parser, content: bytes) -> List[JobPosting]:
+        """Parse a results page in the worker pool and build its postings"""
+        pool = self.get_parse_pool()
+        try:
+            fields = await asyncio.get_running_loop().run_in_executor(pool, parser, content)
+        except BrokenProcessPool:
+            # Start a fresh pool next time rather than failing every later scrape
+            with self.parse_pool_lock:
+                if self.parse_pool is pool:
+                    self.parse_pool = None
+            raise
+        return [JobPosting(**job) for job in fields]
+    
+    def invalidate(self):
+        """Forget cached scrape results so the next analysis scrapes every board again"""
+        self.scrape_cache.clear()
+    
+    async def scrape_cached(self, scrape, fetcher: ThrottledFetcher, keywords: str, location: str, **options) -> List[JobPosting]:
+        """Run a board's scraper unless the same search already ran within the hour"""
+        key = (scrape.__name__, keywords, location, tuple(sorted(options.items())), int(time.time() // SCRAPE_CACHE_TTL))
+        jobs = self.scrape_cache.get(key)
+        if jobs is None:
+            jobs = await scrape(fetcher, keywords, location, **options)
+            # A blocked or failed scrape comes back empty; retry it next time instead
+            if jobs:
+                self.scrape_cache.set(key, jobs)
+        return jobs
+    
+    def close(self):
+        """Shut down the parsing worker processes"""
+        with self.parse_pool_lock:
+            if self.parse_pool is not None and self.parse_pool_pid == os.getpid():
+                self.parse_pool.shutdown()
+            self.parse_pool = None
+    
+    async def scrape_linkedin_jobs(self, fetcher: ThrottledFetcher, keywords: str = "developer OR engineer OR analyst OR manager OR designer OR consultant OR specialist ", location: str = "India", max_pages: int = 2) -> List[JobPosting]:
         """Scrape job postings from LinkedIn (simplified approach due to anti-bot measures)"""
+        logger.info("Scraping LinkedIn for recent postings...")
         jobs = []
         
         try:
@@ -65,133 +285,85 @@ class HiringCompaniesAnalyzer:
                 'location': location,
                 'f_TPR': 'r86400',  # Past 24 hours
                 'f_JT': 'F',  # Full-time
-                'start': 0
             }
             
-            for page in range(max_pages):
-                params['start'] = page * 25
-                
-                try:
-                    response = self.session.get(base_url, params=params, timeout=10)
-                    response.raise_for_status()
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    job_cards = soup.find_all('div', class_='base-card')
-                    
-                    for card in job_cards[:10]:  # Limit to avoid being blocked
-                        try:
-                            title_elem = card.find('h3', class_='base-search-card__title')
-                            title = title_elem.get_text(strip=True) if title_elem else "N/A"
-                            
-                            company_elem = card.find('h4', class_='base-search-card__subtitle')
-                            company = company_elem.get_text(strip=True) if company_elem else "N/A"
-                            
-                            location_elem = card.find('span', class_='job-search-card__location')
-                            location_text = location_elem.get_text(strip=True) if location_elem else "N/A"
-                            
-                            link_elem = card.find('a', class_='base-card__full-link')
-                            job_url = link_elem['href'] if link_elem and 'href' in link_elem.attrs else ""
-                            
-                            job = JobPosting(
-                                company=company,
-                                title=title,
-                                location=location_text,
-                                date_posted="Recent",
-                                url=job_url,
-                                platform="LinkedIn",
-                                job_type="Full-time"
-                            )
-                            jobs.append(job)
-                            
-                        except Exception as e:
-                            logger.warning(f"Error parsing LinkedIn job card: {e}")
-                            continue
-                    
-                    time.sleep(random.uniform(2, 4))  # Longer delay for LinkedIn
-                    
-                except Exception as e:
-                    logger.warning(f"Error accessing LinkedIn page {page}: {e}")
+            # Request every results page at once; the fetcher's per-host limit paces them
+            pages = await asyncio.gather(
+                *(fetcher.fetch(base_url, {**params, 'start': page * 25}) for page in range(max_pages)),
+                return_exceptions=True
+            )
+            
+            parsing = []
+            for page, content in enumerate(pages):
+                if isinstance(content, Exception):
+                    logger.warning(f"Error accessing LinkedIn page {page}: {content}")
                     break
+                parsing.append(self.parse_page(parse_linkedin_page, content))
+            
+            for page_jobs in await asyncio.gather(*parsing):
+                jobs.extend(page_jobs)
                     
         except Exception as e:
             logger.error(f"Error scraping LinkedIn: {e}")
             
         return jobs
     
-    def scrape_indeed_jobs(self, keywords: str = "developer OR engineer OR analyst OR manager OR designer OR consultant OR specialist", location: str = "India", max_pages: int = 3) -> List[JobPosting]:
+    async def scrape_indeed_jobs(self, fetcher: ThrottledFetcher, keywords: str = "developer OR engineer OR analyst OR manager OR designer OR consultant OR specialist", location: str = "India", max_pages: int = 3) -> List[JobPosting]:
         """Enhanced Indeed scraping with more data extraction"""
+        logger.info("Scraping Indeed for latest jobs...")
         jobs = []
         
         try:
-            for page in range(max_pages):
-                url = f"https://www.indeed.com/jobs?q={quote_plus(keywords)}&l={quote_plus(location)}&fromage=1&start={page * 10}"
-                
-                response = self.session.get(url)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                job_cards = soup.find_all('div', class_='job_seen_beacon')
-                
-                for card in job_cards:
-                    try:
-                        # Extract job details
-                        title_elem = card.find('h2', class_='jobTitle')
-                        title = title_elem.find('a').get_text(strip=True) if title_elem else "N/A"
-                        
-                        company_elem = card.find('span', class_='companyName')
-                        company = company_elem.get_text(strip=True) if company_elem else "N/A"
-                        
-                        location_elem = card.find('div', class_='companyLocation')
-                        location_text = location_elem.get_text(strip=True) if location_elem else "N/A"
-                        
-                        date_elem = card.find('span', class_='date')
-                        date_posted = date_elem.get_text(strip=True) if date_elem else "N/A"
-                        
-                        # Get job URL
-                        job_url = ""
-                        if title_elem and title_elem.find('a'):
-                            job_url = urljoin("https://www.indeed.com", title_elem.find('a')['href'])
-                        
-                        # Extract salary if available
-                        salary_elem = card.find('span', class_='estimated-salary')
-                        salary = salary_elem.get_text(strip=True) if salary_elem else None
-                        
-                        # Extract job type and experience level
-                        job_type = "Full-time"  # Default
-                        experience_level = "Not specified"
-                        
-                        # Look for urgency indicators
-                        urgency_indicators = []
-                        if "urgent" in title.lower() or "immediate" in title.lower():
-                            urgency_indicators.append("Urgent hiring")
-                        if "new" in date_posted.lower():
-                            urgency_indicators.append("Recently posted")
-                        
-                        job = JobPosting(
-                            company=company,
-                            title=title,
-                            location=location_text,
-                            date_posted=date_posted,
-                            url=job_url,
-                            platform="Indeed",
-                            salary=salary,
-                            job_type=job_type,
-                            experience_level=experience_level
-                        )
-                        jobs.append(job)
-                        
-                    except Exception as e:
-                        logger.warning(f"Error parsing job card: {e}")
-                        continue
-                
-                # Add delay between requests
-                time.sleep(random.uniform(1, 3))
+            search_url = f"https://www.indeed.com/jobs?q={quote_plus(keywords)}&l={quote_plus(location)}&fromage=1"
+            
+            # Request every results page at once; the fetcher's per-host limit paces them
+            pages = await asyncio.gather(
+                *(fetcher.fetch(f"{search_url}&start={page * 10}") for page in range(max_pages)),
+                return_exceptions=True
+            )
+            
+            parsing = []
+            for content in pages:
+                if isinstance(content, Exception):
+                    logger.error(f"Error scraping Indeed: {content}")
+                    break
+                parsing.append(self.parse_page(parse_indeed_page, content))
+            
+            for page_jobs in await asyncio.gather(*parsing):
+                jobs.extend(page_jobs)
                 
         except Exception as e:
             logger.error(f"Error scraping Indeed: {e}")
             
         return jobs
     
+    def deduplicate_jobs(self, company_jobs: List[JobPosting]) -> List[JobPosting]:
+        """Drop one company's listings that were cross-posted to several boards"""
+        if len(company_jobs) < 2:
+            return company_jobs
+        
+        # Exact repeats first, then near-duplicates by TF-IDF cosine similarity
+        unique = {}
+        for job in company_jobs:
+            unique.setdefault(f"{job.title_lc} {job.location.lower()}", job)
+        if not SKLEARN_AVAILABLE or len(unique) < 2:
+            return list(unique.values())
+        
+        docs = list(unique)
+        unique_jobs = list(unique.values())
+        try:
+            # Whitespace tokens keep titles like "C++ Developer" and "C# Developer" apart
+            vectors = TfidfVectorizer(ngram_range=(1, 2), token_pattern=r'\S+').fit_transform(docs)
+        except ValueError:  # Only blank postings
+            return unique_jobs
+        similarity = cosine_similarity(vectors)
+        
+        kept = [0]
+        for i in range(1, len(docs)):
+            if similarity[i, kept].max() < DUPLICATE_SIMILARITY:
+                kept.append(i)
+        return [unique_jobs[i] for i in kept]
+    
     def analyze_hiring_velocity(self, company_jobs: List[JobPosting]) -> str:
         """Analyze hiring velocity based on job posting frequency"""
         job_count = len(company_jobs)
@@ -205,17 +377,19 @@ class HiringCompaniesAnalyzer:
     
     def extract_urgency_indicators(self, jobs: List[JobPosting]) -> List[str]:
         """Extract urgency indicators from job postings"""
-        indicators = []
+        indicators = set()
         
         for job in jobs:
-            if any(word in job.title.lower() for word in ["urgent", "immediate", "asap"]):
-                indicators.append("Urgent hiring needs")
-            if "today" in job.date_posted.lower() or "1 day" in job.date_posted.lower():
-                indicators.append("Very recent postings")
+            if URGENCY_PATTERN.search(job.title_lc):
+                indicators.add("Urgent hiring needs")
+            if VERY_RECENT_PATTERN.search(job.date_posted):
+                indicators.add("Very recent postings")
             if job.salary and "$" in job.salary:
-                indicators.append("Competitive salary offered")
+                indicators.add("Competitive salary offered")
+            if len(indicators) == 3:  # Every indicator found; the rest can't add any
+                break
         
-        return list(set(indicators))
+        return list(indicators)
     
     def generate_hiring_insights(self, company_name: str, company_jobs: List[JobPosting]) -> HiringInsight:
         """Generate comprehensive hiring insights for a company"""
@@ -223,27 +397,12 @@ class HiringCompaniesAnalyzer:
         # Analyze hiring velocity
         velocity = self.analyze_hiring_velocity(company_jobs)
         
-        # Extract most common roles
-        role_counts = defaultdict(int)
-        for job in company_jobs:
-            # Simplify job titles to common roles
-            title_lower = job.title.lower()
-            if "engineer" in title_lower:
-                role_counts["Software Engineer"] += 1
-            elif "developer" in title_lower:
-                role_counts["Developer"] += 1
-            elif "manager" in title_lower:
-                role_counts["Manager"] += 1
-            elif "analyst" in title_lower:
-                role_counts["Analyst"] += 1
-            else:
-                role_counts[job.title] += 1
-        
-        most_common_roles = sorted(role_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-        most_common_roles = [role[0] for role in most_common_roles]
+        # Extract most common roles, simplifying job titles to common roles
+        role_counts = Counter(classify_title(job.title_lc) or job.title for job in company_jobs)
+        most_common_roles = [role for role, count in role_counts.most_common(3)]
         
         # Extract locations
-        locations = list(set([job.location for job in company_jobs if job.location != "N/A"]))[:5]
+        locations = list({job.location for job in company_jobs if job.location != "N/A"})[:5]
         
         # Extract salary information
         salaries = [job.salary for job in company_jobs if job.salary]
@@ -269,35 +428,27 @@ class HiringCompaniesAnalyzer:
         """Enhanced analysis with real-time insights"""
         logger.info("Starting real-time hiring companies analysis...")
         
-        all_jobs = []
-        
-        # Scrape from multiple platforms with real-time focus
-        logger.info("Scraping LinkedIn for recent postings...")
-        linkedin_jobs = self.scrape_linkedin_jobs(keywords, location, max_pages=2)
-        all_jobs.extend(linkedin_jobs)
-        
-        logger.info("Scraping Indeed for latest jobs...")
-        indeed_jobs = self.scrape_indeed_jobs(keywords, location, max_pages=3)
-        all_jobs.extend(indeed_jobs)
-        
-        logger.info("Scraping Glassdoor...")
-        glassdoor_jobs = self.scrape_glassdoor_jobs(keywords, location, max_pages=2)
-        all_jobs.extend(glassdoor_jobs)
-        
-        logger.info("Scraping Monster...")
-        monster_jobs = self.scrape_monster_jobs(keywords, location)
-        all_jobs.extend(monster_jobs)
+        # Scrape from multiple platforms with real-time focus, all at once
+        linkedin_jobs, indeed_jobs, glassdoor_jobs, monster_jobs = asyncio.run(
+            self.scrape_all_platforms(keywords, location)
+        )
+        all_jobs = linkedin_jobs + indeed_jobs + glassdoor_jobs + monster_jobs
         
         # Analyze companies with insights
         company_stats = {}
         company_insights = {}
         
-        # Group jobs by company
+        # Group jobs by company, dropping listings cross-posted to several boards
         company_jobs = defaultdict(list)
+        unattributed_jobs = []
         for job in all_jobs:
             company = job.company.strip()
             if company and company != "N/A":
                 company_jobs[company].append(job)
+            else:
+                unattributed_jobs.append(job)
+        company_jobs = {company: self.deduplicate_jobs(jobs) for company, jobs in company_jobs.items()}
+        all_jobs = [job for jobs in company_jobs.values() for job in jobs] + unattributed_jobs
         
         # Generate insights for each company
         for company, jobs in company_jobs.items():
@@ -305,8 +456,8 @@ class HiringCompaniesAnalyzer:
             company_stats[company] = {
                 'job_count': len(jobs),
                 'positions': [job.title for job in jobs],
-                'locations': list(set([job.location for job in jobs])),
-                'platforms': list(set([job.platform for job in jobs])),
+                'locations': list({job.location for job in jobs}),
+                'platforms': list({job.platform for job in jobs}),
                 'recent_postings': [{
                     'title': job.title,
                     'location': job.location,
@@ -339,22 +490,29 @@ class HiringCompaniesAnalyzer:
         # Generate market insights
         market_insights = self.generate_market_insights(all_jobs, company_insights)
         
+        # One timestamp for both fields; last_updated is its "YYYY-MM-DD HH:MM:SS" form
+        analyzed_at = datetime.now().isoformat(timespec='seconds')
+        
+        # Per-platform counts after deduplication, so they add up to total_jobs_found;
+        # a cross-posted listing counts for the board whose copy was kept
+        platform_jobs = Counter(job.platform for job in all_jobs)
+        
         result = {
             'total_jobs_found': len(all_jobs),
             'total_companies': len(company_stats),
             'search_keywords': keywords,
             'search_location': location,
-            'analysis_date': datetime.now().isoformat(),
+            'analysis_date': analyzed_at,
             'companies': sorted_companies,
             'company_insights': company_insights,
             'top_hiring_companies': list(sorted_companies.keys())[:20],
             'market_insights': market_insights,
             'real_time_data': {
-                'linkedin_jobs': len(linkedin_jobs),
-                'indeed_jobs': len(indeed_jobs),
-                'glassdoor_jobs': len(glassdoor_jobs),
-                'monster_jobs': len(monster_jobs),
-                'last_updated': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                'linkedin_jobs': platform_jobs['LinkedIn'],
+                'indeed_jobs': platform_jobs['Indeed'],
+                'glassdoor_jobs': platform_jobs['Glassdoor'],
+                'monster_jobs': platform_jobs['Monster'],
+                'last_updated': analyzed_at.replace('T', ' ')
             }
         }
         
@@ -362,6 +520,23 @@ class HiringCompaniesAnalyzer:
         
         return result
     
+    async def scrape_all_platforms(self, keywords: str, location: str) -> List[List[JobPosting]]:
+        """Run every platform scraper concurrently over one HTTP session"""
+        # Pooled keep-alive connections, so the pages of one board reuse their TLS connections
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONCURRENT_REQUESTS,
+            limit_per_host=MAX_REQUESTS_PER_HOST,
+            ttl_dns_cache=300
+        )
+        async with aiohttp.ClientSession(headers=self.headers, timeout=self.timeout, connector=connector) as session:
+            fetcher = ThrottledFetcher(session)
+            return await asyncio.gather(
+                self.scrape_cached(self.scrape_linkedin_jobs, fetcher, keywords, location, max_pages=2),
+                self.scrape_cached(self.scrape_indeed_jobs, fetcher, keywords, location, max_pages=3),
+                self.scrape_cached(self.scrape_glassdoor_jobs, fetcher, keywords, location, max_pages=2),
+                self.scrape_cached(self.scrape_monster_jobs, fetcher, keywords, location),
+            )
+    
     def get_velocity_score(self, velocity: str) -> int:
         """Convert velocity to numeric score for sorting"""
         scores = {'high': 3, 'medium': 2, 'low': 1}
@@ -381,25 +556,17 @@ class HiringCompaniesAnalyzer:
     def generate_market_insights(self, all_jobs: List[JobPosting], company_insights: Dict) -> Dict:
         """Generate overall market insights"""
         
-        # Platform distribution
-        platform_counts = defaultdict(int)
+        # Platform distribution, most in-demand roles and trending locations in one pass
+        platform_counts = Counter()
+        role_counts = Counter()
+        location_counts = Counter()
         for job in all_jobs:
             platform_counts[job.platform] += 1
-        
-        # Most in-demand roles
-        role_counts = defaultdict(int)
-        for job in all_jobs:
-            title_lower = job.title.lower()
-            if "engineer" in title_lower:
-                role_counts["Software Engineer"] += 1
-            elif "developer" in title_lower:
-                role_counts["Developer"] += 1
-            elif "manager" in title_lower:
-                role_counts["Manager"] += 1
-            elif "analyst" in title_lower:
-                role_counts["Analyst"] += 1
-        
-        top_roles = sorted(role_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+            role = classify_title(job.title_lc)
+            if role:
+                role_counts[role] += 1
+            if job.location and job.location != "N/A":
+                location_counts[job.location] += 1
         
         # High-velocity companies
         high_velocity_companies = [
@@ -409,133 +576,41 @@ class HiringCompaniesAnalyzer:
         
         return {
             'platform_distribution': dict(platform_counts),
-            'most_in_demand_roles': dict(top_roles),
+            'most_in_demand_roles': dict(role_counts.most_common(5)),
             'high_velocity_companies_count': len(high_velocity_companies),
             'high_velocity_companies': high_velocity_companies[:10],
             'market_activity': 'High' if len(all_jobs) > 50 else 'Medium' if len(all_jobs) > 20 else 'Low',
-            'trending_locations': self.get_trending_locations(all_jobs)
+            'trending_locations': [loc for loc, count in location_counts.most_common(5)]
         }
     
-    def get_trending_locations(self, jobs: List[JobPosting]) -> List[str]:
-        """Get trending hiring locations"""
-        location_counts = defaultdict(int)
-        for job in jobs:
-            if job.location and job.location != "N/A":
-                location_counts[job.location] += 1
-        
-        return [loc for loc, count in sorted(location_counts.items(), key=lambda x: x[1], reverse=True)[:5]]
-    
-    def scrape_glassdoor_jobs(self, keywords: str = "developer OR engineer OR analyst OR manager OR designer OR consultant OR specialist", location: str = "India", max_pages: int = 2) -> List[JobPosting]:
+    async def scrape_glassdoor_jobs(self, fetcher: ThrottledFetcher, keywords: str = "developer OR engineer OR analyst OR manager OR designer OR consultant OR specialist", location: str = "India", max_pages: int = 2) -> List[JobPosting]:
         """Scrape job postings from Glassdoor"""
+        logger.info("Scraping Glassdoor...")
         jobs = []
         
         try:
             # Note: Glassdoor has anti-bot measures, so this is a simplified approach
             base_url = "https://www.glassdoor.com/Job/jobs.htm"
-            params = {
-                'sc.keyword': keywords,
-                'locT': 'C',
-                'locId': '1',
-                'jobType': '',
-                'fromAge': 1,
-                'minSalary': 0,
-                'includeNoSalaryJobs': 'true',
-                'radius': 25,
-                'cityId': -1,
-                'minRating': 0.0,
-                'industryId': -1,
-                'sgocId': -1,
-                'seniorityType': '',
-                'companyId': -1,
-                'employerSizes': '',
-                'applicationType': '',
-                'remoteWorkType': 0
-            }
-            
-            response = self.session.get(base_url, params=params)
-            response.raise_for_status()
+            params = {'sc.keyword': keywords, **GLASSDOOR_SEARCH_PARAMS}
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Glassdoor uses dynamic loading, so we'll look for basic job elements
-            job_elements = soup.find_all('li', class_='react-job-listing')
-            
-            for job_elem in job_elements[:20]:  # Limit to first 20 jobs
-                try:
-                    # Extract basic information (structure may vary)
-                    title_elem = job_elem.find('a', {'data-test': 'job-title'})
-                    title = title_elem.get_text(strip=True) if title_elem else "N/A"
-                    
-                    company_elem = job_elem.find('span', {'data-test': 'employer-name'})
-                    company = company_elem.get_text(strip=True) if company_elem else "N/A"
-                    
-                    location_elem = job_elem.find('span', {'data-test': 'job-location'})
-                    location_text = location_elem.get_text(strip=True) if location_elem else "N/A"
-                    
-                    job_url = ""
-                    if title_elem and title_elem.find('a'):
-                        job_url = urljoin("https://www.glassdoor.com", title_elem.find('a')['href'])
-                    
-                    job = JobPosting(
-                        company=company,
-                        title=title,
-                        location=location_text,
-                        date_posted="Recent",
-                        url=job_url,
-                        platform="Glassdoor"
-                    )
-                    jobs.append(job)
-                    
-                except Exception as e:
-                    logger.warning(f"Error parsing Glassdoor job: {e}")
-                    continue
+            content = await fetcher.fetch(base_url, params)
+            jobs = await self.parse_page(parse_glassdoor_page, content)
                     
         except Exception as e:
             logger.error(f"Error scraping Glassdoor: {e}")
             
         return jobs
     
-    def scrape_monster_jobs(self, keywords: str = "developer OR engineer OR analyst OR manager OR designer OR consultant OR specialist", location: str = "India") -> List[JobPosting]:
+    async def scrape_monster_jobs(self, fetcher: ThrottledFetcher, keywords: str = "developer OR engineer OR analyst OR manager OR designer OR consultant OR specialist", location: str = "India") -> List[JobPosting]:
         """Scrape job postings from Monster"""
+        logger.info("Scraping Monster...")
         jobs = []
         
         try:
             url = f"https://www.monster.com/jobs/search/?q={quote_plus(keywords)}&where={quote_plus(location)}"
             
-            response = self.session.get(url)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            job_cards = soup.find_all('section', class_='card-content')
-            
-            for card in job_cards:
-                try:
-                    title_elem = card.find('h2', class_='title')
-                    title = title_elem.find('a').get_text(strip=True) if title_elem and title_elem.find('a') else "N/A"
-                    
-                    company_elem = card.find('div', class_='company')
-                    company = company_elem.find('span').get_text(strip=True) if company_elem and company_elem.find('span') else "N/A"
-                    
-                    location_elem = card.find('div', class_='location')
-                    location_text = location_elem.find('span').get_text(strip=True) if location_elem and location_elem.find('span') else "N/A"
-                    
-                    job_url = ""
-                    if title_elem and title_elem.find('a'):
-                        job_url = urljoin("https://www.monster.com", title_elem.find('a')['href'])
-                    
-                    job = JobPosting(
-                        company=company,
-                        title=title,
-                        location=location_text,
-                        date_posted="Recent",
-                        url=job_url,
-                        platform="Monster"
-                    )
-                    jobs.append(job)
-                    
-                except Exception as e:
-                    logger.warning(f"Error parsing Monster job: {e}")
-                    continue
+            content = await fetcher.fetch(url)
+            jobs = await self.parse_page(parse_monster_page, content)
                     
         except Exception as e:
             logger.error(f"Error scraping Monster: {e}")
@@ -548,15 +623,25 @@ class HiringCompaniesAnalyzer:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"hiring_analysis_{timestamp}.json"
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
         
         logger.info(f"Results saved to {filename}")
         return filename
 
 # Example usage
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze which companies are currently hiring")
+    parser.add_argument('--refresh', action='store_true', help="ignore scrape results cached within the last hour")
+    args = parser.parse_args()
+    
     analyzer = HiringCompaniesAnalyzer()
+    if args.refresh:
+        analyzer.invalidate()
     
     # Analyze hiring companies with real-time insights
     results = analyzer.analyze_hiring_companies(
@@ -564,6 +649,8 @@ if __name__ == "__main__":
         location="India"
     )
     
+    analyzer.close()
+    
     # Save results
     filename = analyzer.save_analysis_results(results)
     
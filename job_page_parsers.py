@@ -0,0 +1,211 @@
+# Job board result page parsers, run in HiringCompaniesAnalyzer's spawned worker processes.
+# They live apart from hiring_companies_analyzer so a worker only imports the HTML parser
+# it uses, not aiohttp, scikit-learn or diskcache.
+import re
+import logging
+import importlib.util
+from urllib.parse import urljoin
+from typing import List, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# selectolax's lexbor parser is much faster than BeautifulSoup; bs4 remains the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    from bs4 import BeautifulSoup, SoupStrainer
+    SELECTOLAX_AVAILABLE = False
+    logger.info("selectolax not available - parsing with BeautifulSoup")
+
+# lxml tokenizes in C, so BeautifulSoup builds its tree faster than with the pure-Python parser
+BS4_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
+# Job card selectors of each board, as 'tag.class'
+LINKEDIN_CARD = 'div.base-card'
+INDEED_CARD = 'div.job_seen_beacon'
+GLASSDOOR_CARD = 'li.react-job-listing'
+MONSTER_CARD = 'section.card-content'
+
+def card_strainer(selector: str) -> "SoupStrainer":
+    """SoupStrainer matching a 'tag.class' selector, including elements with extra classes"""
+    tag, css_class = selector.split('.')
+    return SoupStrainer(tag, class_=re.compile(rf'(?:^|\s){re.escape(css_class)}(?:\s|$)'))
+
+# Let BeautifulSoup build only the job card subtrees and skip the rest of the page
+CARD_STRAINERS = {} if SELECTOLAX_AVAILABLE else {
+    selector: card_strainer(selector)
+    for selector in (LINKEDIN_CARD, INDEED_CARD, GLASSDOOR_CARD, MONSTER_CARD)
+}
+
+def select_cards(content: bytes, selector: str) -> list:
+    """Parse a results page and return the job card nodes matching a CSS selector"""
+    if SELECTOLAX_AVAILABLE:
+        return LexborHTMLParser(content.decode('utf-8', 'replace')).css(selector)
+    soup = BeautifulSoup(content, BS4_PARSER, parse_only=CARD_STRAINERS.get(selector))
+    return soup.select(selector)
+
+def css_first(node, selector: str):
+    """First descendant of a parsed node matching a CSS selector, or None"""
+    if node is None:
+        return None
+    if SELECTOLAX_AVAILABLE:
+        return node.css_first(selector)
+    return node.select_one(selector)
+
+def node_text(node, default: Optional[str] = "N/A") -> Optional[str]:
+    """Stripped text of a parsed node, or default when the node is missing"""
+    if node is None:
+        return default
+    if SELECTOLAX_AVAILABLE:
+        return node.text(strip=True)
+    return node.get_text(strip=True)
+
+def node_attr(node, name: str) -> Optional[str]:
+    """Attribute value of a parsed node, or None when the node or attribute is missing"""
+    if node is None:
+        return None
+    if SELECTOLAX_AVAILABLE:
+        return node.attributes.get(name)
+    return node.get(name)
+
+# Page parsers return plain dicts of JobPosting fields, which are cheaper to send back
+# from the worker processes than dataclass instances
+def parse_linkedin_page(content: bytes) -> List[Dict]:
+    """Parse the job cards of one LinkedIn results page"""
+    jobs = []
+    
+    for card in select_cards(content, LINKEDIN_CARD)[:10]:  # Limit to avoid being blocked
+        try:
+            title = node_text(css_first(card, 'h3.base-search-card__title'))
+            company = node_text(css_first(card, 'h4.base-search-card__subtitle'))
+            location_text = node_text(css_first(card, 'span.job-search-card__location'))
+            job_url = node_attr(css_first(card, 'a.base-card__full-link'), 'href') or ""
+            
+            jobs.append({
+                'company': company,
+                'title': title,
+                'location': location_text,
+                'date_posted': "Recent",
+                'url': job_url,
+                'platform': "LinkedIn",
+                'job_type': "Full-time"
+            })
+            
+        except Exception as e:
+            logger.warning(f"Error parsing LinkedIn job card: {e}")
+            continue
+    
+    return jobs
+
+def parse_indeed_page(content: bytes) -> List[Dict]:
+    """Parse the job cards of one Indeed results page"""
+    jobs = []
+    
+    for card in select_cards(content, INDEED_CARD):
+        try:
+            # Extract job details
+            title_link = css_first(card, 'h2.jobTitle a')
+            title = node_text(title_link)
+            company = node_text(css_first(card, 'span.companyName'))
+            location_text = node_text(css_first(card, 'div.companyLocation'))
+            date_posted = node_text(css_first(card, 'span.date'))
+            
+            # Get job URL
+            job_url = ""
+            if title_link:
+                job_url = urljoin("https://www.indeed.com", node_attr(title_link, 'href'))
+            
+            # Extract salary if available
+            salary = node_text(css_first(card, 'span.estimated-salary'), None)
+            
+            # Extract job type and experience level
+            job_type = "Full-time"  # Default
+            experience_level = "Not specified"
+            
+            # Look for urgency indicators
+            urgency_indicators = []
+            if "urgent" in title.lower() or "immediate" in title.lower():
+                urgency_indicators.append("Urgent hiring")
+            if "new" in date_posted.lower():
+                urgency_indicators.append("Recently posted")
+            
+            jobs.append({
+                'company': company,
+                'title': title,
+                'location': location_text,
+                'date_posted': date_posted,
+                'url': job_url,
+                'platform': "Indeed",
+                'salary': salary,
+                'job_type': job_type,
+                'experience_level': experience_level
+            })
+            
+        except Exception as e:
+            logger.warning(f"Error parsing job card: {e}")
+            continue
+    
+    return jobs
+
+def parse_glassdoor_page(content: bytes) -> List[Dict]:
+    """Parse the job listings of a Glassdoor results page"""
+    jobs = []
+    
+    # Glassdoor uses dynamic loading, so we'll look for basic job elements
+    for job_elem in select_cards(content, GLASSDOOR_CARD)[:20]:  # Limit to first 20 jobs
+        try:
+            # Extract basic information (structure may vary)
+            title_elem = css_first(job_elem, 'a[data-test="job-title"]')
+            title = node_text(title_elem)
+            company = node_text(css_first(job_elem, 'span[data-test="employer-name"]'))
+            location_text = node_text(css_first(job_elem, 'span[data-test="job-location"]'))
+            
+            # The title element is itself the job link
+            href = node_attr(title_elem, 'href')
+            job_url = urljoin("https://www.glassdoor.com", href) if href else ""
+            
+            jobs.append({
+                'company': company,
+                'title': title,
+                'location': location_text,
+                'date_posted': "Recent",
+                'url': job_url,
+                'platform': "Glassdoor"
+            })
+            
+        except Exception as e:
+            logger.warning(f"Error parsing Glassdoor job: {e}")
+            continue
+    
+    return jobs
+
+def parse_monster_page(content: bytes) -> List[Dict]:
+    """Parse the job cards of a Monster results page"""
+    jobs = []
+    
+    for card in select_cards(content, MONSTER_CARD):
+        try:
+            title_link = css_first(card, 'h2.title a')
+            title = node_text(title_link)
+            company = node_text(css_first(card, 'div.company span'))
+            location_text = node_text(css_first(card, 'div.location span'))
+            
+            job_url = ""
+            if title_link:
+                job_url = urljoin("https://www.monster.com", node_attr(title_link, 'href'))
+            
+            jobs.append({
+                'company': company,
+                'title': title,
+                'location': location_text,
+                'date_posted': "Recent",
+                'url': job_url,
+                'platform': "Monster"
+            })
+            
+        except Exception as e:
+            logger.warning(f"Error parsing Monster job: {e}")
+            continue
+    
+    return jobs
@@ -1,118 +1,290 @@
 import os
 import re
-import PyPDF2
+import sys
+import mmap
+import hashlib
+import functools
+import logging
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pypdf import PdfReader
 from docx import Document
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Tuple, FrozenSet, Union, Optional, BinaryIO, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# WordprocessingML paragraph and run-content tags, for walking a DOCX body directly
+WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+WORD_PARAGRAPH = WORD_NS + 'p'
+WORD_RUN = WORD_NS + 'r'
+WORD_TEXT = WORD_NS + 't'
+# Tabs and line/carriage breaks inside a run, rendered the way python-docx's paragraph.text does
+WORD_RUN_SEPARATORS = {WORD_NS + 'tab': '\t', WORD_NS + 'br': '\n', WORD_NS + 'cr': '\n'}
+
+# Resumes handed to each batch worker at a time
+BATCH_CHUNKSIZE = 8
+
+# Leading bytes of each supported format (a DOCX is a zip archive)
+FILE_SIGNATURES = {b'%PDF-': '.pdf', b'PK\x03\x04': '.docx'}
+
+# Results for recently processed files, keyed by a hash of their bytes; re-uploads skip parsing
+RESULT_CACHE_MAXSIZE = 1024
+# Larger files aren't worth hashing and keeping around
+RESULT_CACHE_MAX_FILE_SIZE = 16 * 1024 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Only the start of the cleaned text is returned with the skills; nothing reads the rest
+RESUME_PREVIEW_CHARS = 2000
+
+# Aho-Corasick finds every skill in one linear pass; the alternation regex is the fallback
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logger.info("pyahocorasick not available - matching skills with a regex")
+
+# Hyperscan scans for all skills at once with SIMD; it is preferred over the automaton where installed
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    logger.info("hyperscan not available - matching skills without it")
+
+# Hyperscan scratch space can't be shared by concurrent scans, so each thread keeps its own
+_hs_local = threading.local()
+
+def _word_char_before(data: bytes, pos: int) -> bool:
+    """Whether the UTF-8 character ending at byte offset pos is a letter or digit"""
+    if pos <= 0:
+        return False
+    start = pos - 1
+    if data[start] < 0x80:
+        return chr(data[start]).isalnum()
+    # Step back over continuation bytes to the start of the character
+    while start > 0 and data[start] & 0xC0 == 0x80:
+        start -= 1
+    return data[start:pos].decode('utf-8', 'ignore').isalnum()
+
+def _word_char_at(data: bytes, pos: int) -> bool:
+    """Whether the UTF-8 character starting at byte offset pos is a letter or digit"""
+    if pos >= len(data):
+        return False
+    if data[pos] < 0x80:
+        return chr(data[pos]).isalnum()
+    end = pos + 1
+    while end < len(data) and data[end] & 0xC0 == 0x80:
+        end += 1
+    return data[pos:end].decode('utf-8', 'ignore').isalnum()
+
+@functools.lru_cache(maxsize=4096)
+def _canonical_skills(skills: FrozenSet[str]) -> Tuple[str, ...]:
+    """Sorted skill tuple, shared by every resume with the same set of skills"""
+    return tuple(sorted(skills))
 
 class ResumeProcessor:
+    # Comprehensive technical skills database
+    technical_skills = {
+        'languages': [
+            'python', 'javascript', 'java', 'c++', 'c#', 'c', 'php', 'ruby', 'go', 'swift', 
+            'kotlin', 'typescript', 'r', 'scala', 'rust', 'dart', 'perl', 'haskell', 'lua', 'matlab'
+        ],
+        'web_frontend': [
+            'html', 'html5', 'css', 'css3', 'sass', 'less', 'bootstrap', 'tailwind', 'material ui',
+            'react', 'angular', 'vue', 'vue.js', 'vuejs', 'svelte', 'next.js', 'nuxt.js', 'gatsby',
+            'redux', 'mobx', 'graphql', 'apollo', 'webpack', 'babel', 'npm', 'yarn', 'vite', 'parcel'
+        ],
+        'web_backend': [
+            'node', 'node.js', 'express', 'nest.js', 'django', 'flask', 'fastapi', 'spring', 'spring boot',
+            'ruby on rails', 'laravel', 'asp.net', 'asp.net core', '.net core', 'play framework',
+            'phoenix', 'gin', 'echo', 'koa', 'hapi', 'sails.js', 'loopback', 'adonis.js', 'slim',
+            'fastify', 'hono', 'deno', 'bun'
+        ],
+        'mobile': [
+            'react native', 'flutter', 'ios', 'android', 'swift', 'kotlin', 'objective-c', 'xamarin',
+            'ionic', 'phonegap', 'cordova', 'capacitor', 'kmm'
+        ],
+        'databases': [
+            'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sql server', 'sqlite', 'mariadb',
+            'cassandra', 'couchbase', 'dynamodb', 'firebase', 'firestore', 'realm', 'neo4j', 'arangodb',
+            'couchdb', 'rethinkdb', 'influxdb', 'timescaledb', 'cockroachdb', 'scylladb', 'cosmosdb'
+        ],
+        'devops': [
+            'docker', 'kubernetes', 'helm', 'terraform', 'ansible', 'puppet', 'chef', 'jenkins',
+            'github actions', 'gitlab ci', 'circleci', 'travis ci', 'argo cd', 'flux', 'crossplane',
+            'spinnaker', 'tekton', 'pulumi', 'serverless', 'aws cdk', 'sst'
+        ],
+        'cloud': [
+            'aws', 'amazon web services', 'azure', 'google cloud', 'gcp', 'digitalocean', 'heroku',
+            'vercel', 'netlify', 'cloudflare', 'cloudflare workers', 'cloudflare pages', 'cloud run',
+            'cloud functions', 'lambda', 'ec2', 's3', 'rds', 'dynamodb', 'aurora', 'sns', 'sqs', 'ses',
+            'ecs', 'eks', 'fargate', 'cloudfront', 'route 53', 'vpc', 'iam', 'cognito', 'app sync',
+            'app runner', 'lightsail', 'elastic beanstalk', 'elasticache', 'opensearch', 'kinesis',
+            'msk'
+        ],
+        'data_science': [
+            'pandas', 'numpy', 'scipy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras', 'opencv',
+            'nltk', 'spacy', 'huggingface', 'transformers', 'datasets', 'tokenizers', 'ray', 'dask',
+            'pyspark', 'apache spark', 'hadoop', 'hive', 'hbase', 'kafka', 'flink', 'beam', 'airflow',
+            'prefect', 'dagster', 'mlflow', 'kubeflow', 'sagemaker', 'vertex ai', 'h2o', 'rapids'
+        ],
+        'testing': [
+            'jest', 'mocha', 'jasmine', 'karma', 'cypress', 'playwright', 'puppeteer', 'selenium',
+            'testcafe', 'testing library', 'react testing library', 'enzyme', 'vitest', 'junit',
+            'testng', 'pytest', 'unittest', 'rspec', 'cucumber', 'jbehave', 'serenity bdd', 'mabl',
+            'appium', 'detox', 'espresso', 'xcuitest', 'xctest'
+        ],
+        'security': [
+            'owasp', 'jwt', 'oauth', 'openid connect', 'saml', 'ldap', 'rbac', 'abac', 'pam', 'tls',
+            'ssl', 'waf', 'siem', 'soc', 'vpn', 'vpc', 'sg', 'nacl', 'iam', 'pim', 'pdp', 'pep',
+            'pip'
+        ]
+    }
+    
+    # Normalization mapping for common variations
+    skill_normalization = {
+        'js': 'javascript',
+        'reactjs': 'react',
+        'vuejs': 'vue',
+        'vue.js': 'vue',
+        'nextjs': 'next.js',
+        'nodejs': 'node.js',
+        'nestjs': 'nest.js',
+        'aws': 'amazon web services',
+        'gcp': 'google cloud',
+        'postgres': 'postgresql',
+        'mongo': 'mongodb',
+        'ms sql': 'sql server',
+        'ms sql server': 'sql server',
+        'azure functions': 'azure functions',
+    }
+    
+    # Compile regex patterns once for every instance
+    # Emails only start at the beginning of a [\w.-] run (a later start would hit the same '@'),
+    # and the possessive local part never backtracks looking for an '@' it can't contain
+    email_pattern = re.compile(r'(?<![\w\.-])[\w\.-]++@[\w\.-]+\.\w+')
+    url_pattern = re.compile(r'https?://\S+|www\.\S+')
+    phone_pattern = re.compile(r'\b(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b')
+    # All three as one alternation, so cleaning walks the text once
+    pii_pattern = re.compile('|'.join(f'(?:{p.pattern})' for p in (email_pattern, url_pattern, phone_pattern)))
+
     def __init__(self):
-        # Comprehensive technical skills database
-        self.technical_skills = {
-            'languages': [
-                'python', 'javascript', 'java', 'c++', 'c#', 'c', 'php', 'ruby', 'go', 'swift', 
-                'kotlin', 'typescript', 'r', 'scala', 'rust', 'dart', 'perl', 'haskell', 'lua', 'matlab'
-            ],
-            'web_frontend': [
-                'html', 'html5', 'css', 'css3', 'sass', 'less', 'bootstrap', 'tailwind', 'material ui',
-                'react', 'angular', 'vue', 'vue.js', 'vuejs', 'svelte', 'next.js', 'nuxt.js', 'gatsby',
-                'redux', 'mobx', 'graphql', 'apollo', 'webpack', 'babel', 'npm', 'yarn', 'vite', 'parcel'
-            ],
-            'web_backend': [
-                'node', 'node.js', 'express', 'nest.js', 'django', 'flask', 'fastapi', 'spring', 'spring boot',
-                'ruby on rails', 'laravel', 'asp.net', 'asp.net core', '.net core', 'play framework',
-                'phoenix', 'gin', 'echo', 'koa', 'hapi', 'sails.js', 'loopback', 'adonis.js', 'slim',
-                'fastify', 'hono', 'deno', 'bun'
-            ],
-            'mobile': [
-                'react native', 'flutter', 'ios', 'android', 'swift', 'kotlin', 'objective-c', 'xamarin',
-                'ionic', 'phonegap', 'cordova', 'capacitor', 'kmm', 'kmm', 'kmm', 'kmm', 'kmm'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sql server', 'sqlite', 'mariadb',
-                'cassandra', 'couchbase', 'dynamodb', 'firebase', 'firestore', 'realm', 'neo4j', 'arangodb',
-                'couchdb', 'rethinkdb', 'influxdb', 'timescaledb', 'cockroachdb', 'scylladb', 'cosmosdb'
-            ],
-            'devops': [
-                'docker', 'kubernetes', 'helm', 'terraform', 'ansible', 'puppet', 'chef', 'jenkins',
-                'github actions', 'gitlab ci', 'circleci', 'travis ci', 'argo cd', 'flux', 'crossplane',
-                'spinnaker', 'tekton', 'pulumi', 'serverless', 'aws cdk', 'sst', 'sst', 'sst', 'sst'
-            ],
-            'cloud': [
-                'aws', 'amazon web services', 'azure', 'google cloud', 'gcp', 'digitalocean', 'heroku',
-                'vercel', 'netlify', 'cloudflare', 'cloudflare workers', 'cloudflare pages', 'cloud run',
-                'cloud functions', 'lambda', 'ec2', 's3', 'rds', 'dynamodb', 'aurora', 'sns', 'sqs', 'ses',
-                'ecs', 'eks', 'fargate', 'cloudfront', 'route 53', 'vpc', 'iam', 'cognito', 'app sync',
-                'app runner', 'lightsail', 'elastic beanstalk', 'elasticache', 'opensearch', 'kinesis',
-                'msk', 'msk', 'msk', 'msk'
-            ],
-            'data_science': [
-                'pandas', 'numpy', 'scipy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras', 'opencv',
-                'nltk', 'spacy', 'huggingface', 'transformers', 'datasets', 'tokenizers', 'ray', 'dask',
-                'pyspark', 'apache spark', 'hadoop', 'hive', 'hbase', 'kafka', 'flink', 'beam', 'airflow',
-                'prefect', 'dagster', 'mlflow', 'kubeflow', 'sagemaker', 'vertex ai', 'h2o', 'rapids',
-                'rapids', 'rapids', 'rapids'
-            ],
-            'testing': [
-                'jest', 'mocha', 'jasmine', 'karma', 'cypress', 'playwright', 'puppeteer', 'selenium',
-                'testcafe', 'testing library', 'react testing library', 'enzyme', 'vitest', 'junit',
-                'testng', 'pytest', 'unittest', 'rspec', 'cucumber', 'jbehave', 'serenity bdd', 'mabl',
-                'appium', 'detox', 'espresso', 'xcuitest', 'xctest', 'junit', 'testng', 'testng', 'testng'
-            ],
-            'security': [
-                'owasp', 'jwt', 'oauth', 'openid connect', 'saml', 'ldap', 'rbac', 'abac', 'pam', 'tls',
-                'ssl', 'waf', 'siem', 'soc', 'vpn', 'vpc', 'sg', 'nacl', 'iam', 'pim', 'pam', 'pdp', 'pep',
-                'pip', 'pip', 'pip', 'pip', 'pip'
-            ]
-        }
-        
-        # Normalization mapping for common variations
-        self.skill_normalization = {
-            'js': 'javascript',
-            'reactjs': 'react',
-            'vuejs': 'vue',
-            'vue.js': 'vue',
-            'nextjs': 'next.js',
-            'nodejs': 'node.js',
-            'nestjs': 'nest.js',
-            'aws': 'amazon web services',
-            'gcp': 'google cloud',
-            'postgres': 'postgresql',
-            'mongo': 'mongodb',
-            'ms sql': 'sql server',
-            'ms sql server': 'sql server',
-            'azure functions': 'azure functions',
-            'azure functions': 'azure functions',
-            'azure functions': 'azure functions',
-        }
-        
-        # Compile regex patterns for better performance
-        self.email_pattern = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
-        self.url_pattern = re.compile(r'https?://\S+|www\.\S+')
-        self.phone_pattern = re.compile(r'\b(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b')
-        self.skill_pattern = self._build_skill_pattern()
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+
+    @classmethod
+    def _build_skill_matcher(cls):
+        """Build the skill lookup and matcher shared by all instances"""
+        # Every distinct skill, longest first so the alternation prefers longer phrases
+        all_skills = {skill.lower() for category in cls.technical_skills.values() for skill in category}
+        cls._all_skills = sorted(all_skills, key=len, reverse=True)
+        # Skills are a fixed set, so normalize each one once instead of per match; interning
+        # lets every extracted skill share one string object across resumes
+        cls._normalized_lookup = {skill: sys.intern(cls._normalize_skill(skill)) for skill in cls._all_skills}
+        # Words of a page's end that may begin a skill finished on the next page
+        cls._page_carry_words = max(len(skill.split()) for skill in cls._all_skills) - 1
+        cls._hs_db = cls._ac = cls.skill_pattern = None
+        if HYPERSCAN_AVAILABLE:
+            try:
+                cls._hs_db = cls._build_skill_database()
+            except hyperscan.error as e:
+                # e.g. a CPU without the instructions Hyperscan needs
+                logger.warning("Could not build Hyperscan database: %s", e)
+        if cls._hs_db is None:
+            if AHOCORASICK_AVAILABLE:
+                cls._ac = cls._build_skill_automaton()
+            else:
+                cls.skill_pattern = cls._build_skill_pattern()
     
-    def _build_skill_pattern(self):
+    @classmethod
+    def _build_skill_pattern(cls):
         """Build a regex pattern to match all skills"""
-        all_skills = []
-        for category in self.technical_skills.values():
-            all_skills.extend(category)
+        # Escape special regex characters and create pattern; like the automaton's neighbour
+        # check, a skill can't touch a letter or digit ([^\W_]), so 'c++' and '.net core' match too
+        escaped_skills = [re.escape(skill) for skill in cls._all_skills]
+        pattern = r'(?<![^\W_])(' + '|'.join(escaped_skills) + r')(?![^\W_])'
+        
+        return re.compile(pattern, re.IGNORECASE)
+
+    @classmethod
+    def _build_skill_automaton(cls):
+        """Build an Aho-Corasick automaton over all skills"""
+        automaton = ahocorasick.Automaton()
+        for skill in cls._all_skills:
+            automaton.add_word(skill, skill)
+        automaton.make_automaton()
+        return automaton
+
+    @classmethod
+    def _build_skill_database(cls):
+        """Compile a Hyperscan block-mode database over all skills (id = index in _all_skills)"""
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=[re.escape(skill).encode() for skill in cls._all_skills],
+            ids=list(range(len(cls._all_skills))),
+            elements=len(cls._all_skills),
+            # Start offsets are needed for the boundary checks and the longest-match sweep
+            flags=hyperscan.HS_FLAG_SOM_LEFTMOST
+        )
+        return database
+
+    @staticmethod
+    def _longest_hits(hits: List[tuple]) -> List[str]:
+        """Resolve overlapping (start, end, skill) hits to the skills a length-sorted alternation would match"""
+        # Like the length-sorted alternation, prefer the longest hit at a position
+        # ("react native" over "react") and skip hits inside an earlier one
+        hits.sort(key=lambda hit: (hit[0], hit[0] - hit[1]))
+        skills = []
+        last_end = -1
+        for start, end, skill in hits:
+            if start > last_end:
+                skills.append(skill)
+                last_end = end
+        return skills
+
+    def _scan_skills(self, text_lower: str) -> List[str]:
+        """Find whole-word skill hits in lowercased text with Hyperscan"""
+        scratch = getattr(_hs_local, 'scratch', None)
+        if scratch is None:
+            scratch = _hs_local.scratch = hyperscan.Scratch(self._hs_db)
         
-        # Sort by length in descending order to match longer phrases first
-        all_skills = sorted(list(set(all_skills)), key=len, reverse=True)
+        data = text_lower.encode('utf-8', 'ignore')
+        all_skills = self._all_skills
+        hits = []
         
-        # Escape special regex characters and create pattern
-        escaped_skills = [re.escape(skill) for skill in all_skills]
-        pattern = r'\b(' + '|'.join(escaped_skills) + r')\b'
+        def on_match(skill_id, start, end, flags, context):
+            # Only keep hits that aren't glued to a neighbouring letter or digit
+            if not (_word_char_before(data, start) or _word_char_at(data, end)):
+                hits.append((start, end - 1, all_skills[skill_id]))
         
-        return re.compile(pattern, re.IGNORECASE)
+        self._hs_db.scan(data, match_event_handler=on_match, scratch=scratch)
+        return self._longest_hits(hits)
+
+    def _find_skills(self, text_lower: str) -> List[str]:
+        """Find whole-word skill hits in lowercased text with the automaton"""
+        hits = []
+        last = len(text_lower) - 1
+        for end, skill in self._ac.iter(text_lower):
+            start = end - len(skill) + 1
+            # Only keep hits that aren't glued to a neighbouring letter or digit
+            if start > 0 and text_lower[start - 1].isalnum():
+                continue
+            if end < last and text_lower[end + 1].isalnum():
+                continue
+            hits.append((start, end, skill))
+        return self._longest_hits(hits)
     
-    def _normalize_skill(self, skill: str) -> str:
+    @classmethod
+    def _normalize_skill(cls, skill: str) -> str:
         """Normalize skill name to a standard format"""
         # Convert to lowercase and strip whitespace
         skill = skill.lower().strip()
         
         # Apply normalization mappings
-        skill = self.skill_normalization.get(skill, skill)
+        skill = cls.skill_normalization.get(skill, skill)
         
         # Handle special cases
         if skill == 'js':
@@ -145,60 +317,108 @@ class ResumeProcessor:
         
         return ' '.join(normalized_parts)
 
-    def extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file."""
+    def iter_pdf_pages(self, file: Union[str, BinaryIO]) -> Iterator[str]:
+        """Yield the raw text of each page of a PDF, one page at a time."""
         try:
-            with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                text = ''
-                for page in reader.pages:
-                    text += page.extract_text() + '\n'
-                # Basic cleaning
-                text = self._clean_text(text)
-                return text
-        except Exception as e:
-            print(f"Error extracting text from PDF: {e}")
-            return ""
+            reader = PdfReader(file)
+            for page in reader.pages:
+                yield page.extract_text() or ''
+        except Exception:
+            logger.exception("Error extracting text from PDF")
 
-    def extract_text_from_docx(self, file_path: str) -> str:
-        """Extract text from DOCX file."""
+    def extract_text_from_pdf(self, file: Union[str, BinaryIO]) -> str:
+        """Extract text from a PDF file path or binary file object."""
+        # Join the pages once rather than growing a string page by page
+        text = '\n'.join(self.iter_pdf_pages(file))
+        # Basic cleaning
+        return self._clean_text(text)
+
+    def extract_text_from_docx(self, file: Union[str, BinaryIO]) -> str:
+        """Extract text from a DOCX file path or binary file object."""
         try:
-            doc = Document(file_path)
-            return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-        except Exception as e:
-            print(f"Error extracting text from DOCX: {e}")
+            doc = Document(file)
+            # Walk the body XML once instead of building a Paragraph object per paragraph;
+            # this also picks up text in tables
+            parts = []
+            for element in doc.element.body.iter(WORD_PARAGRAPH, WORD_TEXT, *WORD_RUN_SEPARATORS):
+                tag = element.tag
+                if tag == WORD_PARAGRAPH:
+                    parts.append('\n')
+                elif tag == WORD_TEXT:
+                    if element.text:
+                        parts.append(element.text)
+                # w:tab also defines tab stops in paragraph properties; only run content counts
+                elif element.getparent().tag == WORD_RUN:
+                    parts.append(WORD_RUN_SEPARATORS[tag])
+            return ''.join(parts)
+        except Exception:
+            logger.exception("Error extracting text from DOCX")
             return ""
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text."""
-        # Remove email addresses
-        text = self.email_pattern.sub('', text)
-        # Remove URLs
-        text = self.url_pattern.sub('', text)
-        # Remove phone numbers
-        text = self.phone_pattern.sub('', text)
+        # Remove email addresses, URLs and phone numbers
+        text = self.pii_pattern.sub('', text)
         # Remove multiple spaces and newlines
         text = ' '.join(text.split())
         return text.strip()
 
-    def extract_skills(self, text: str) -> List[str]:
+    def _match_skills(self, text_lower: str) -> List[str]:
+        """Find the (lowercase) skills mentioned in lowercased text."""
+        if self._hs_db is not None:
+            return self._scan_skills(text_lower)
+        if self._ac is not None:
+            return self._find_skills(text_lower)
+        # Find all matches using the pre-built pattern
+        return [match.group(0) for match in self.skill_pattern.finditer(text_lower)]
+
+    def extract_skills(self, text: str) -> Tuple[str, ...]:
         """Extract and normalize skills from text."""
         if not text:
-            return []
+            return ()
             
         # Find all skill matches
         matches = set()
-        text_lower = text.lower()
+        for skill in self._match_skills(text.lower()):
+            matches.add(self._normalized_lookup[skill])
         
-        # Find all matches using the pre-built pattern
-        for match in self.skill_pattern.finditer(text_lower):
-            skill = match.group(0).lower()
-            normalized_skill = self._normalize_skill(skill)
-            matches.add(normalized_skill)
+        return _canonical_skills(frozenset(matches))
+
+    def extract_skills_streaming(self, pages: Iterable[str], preview: Optional[List[str]] = None) -> Tuple[str, ...]:
+        """
+        Extract and normalize skills from raw page texts, holding one page at a time.
+        
+        The last few words of each page are scanned again at the start of the next
+        one, so a multi-word skill broken across a page break ("Spring" / "Boot")
+        is still found.
         
-        return sorted(list(matches))
+        Args:
+            pages: Raw text of each page, e.g. from iter_pdf_pages
+            preview: If given, the first RESUME_PREVIEW_CHARS of cleaned text are appended to it
+            
+        Returns:
+            Sorted normalized skills found on any page
+        """
+        matches = set()
+        preview_len = 0
+        carry = ''
+        for page in pages:
+            text = self._clean_text(page)
+            if not text:
+                continue
+            if preview is not None and preview_len < RESUME_PREVIEW_CHARS:
+                part = text[:RESUME_PREVIEW_CHARS - preview_len]
+                preview.append(part)
+                preview_len += len(part) + 1
+            text_lower = f"{carry} {text.lower()}" if carry else text.lower()
+            for skill in self._match_skills(text_lower):
+                matches.add(self._normalized_lookup[skill])
+            if self._page_carry_words:
+                carry = ' '.join(text_lower.rsplit(' ', self._page_carry_words)[-self._page_carry_words:])
+        
+        return _canonical_skills(frozenset(matches))
 
-    def process_resume(self, file_path: str) -> Dict[str, Union[str, List[str]]]:
+    def process_resume(self, file_path: str) -> Dict[str, Union[str, Tuple[str, ...]]]:
         """
         Process a resume file and extract skills.
         
@@ -206,7 +426,7 @@ class ResumeProcessor:
             file_path: Path to the resume file (PDF or DOCX)
             
         Returns:
-            Dictionary with status, cleaned text, and extracted skills
+            Dictionary with status, a preview of the cleaned text, and extracted skills
         """
         if not os.path.exists(file_path):
             return {
@@ -216,29 +436,140 @@ class ResumeProcessor:
             
         # Determine file type and extract text
         file_ext = os.path.splitext(file_path)[1].lower()
-        text = ""
+        return self.process_resume_stream(file_path, file_ext)
+
+    @classmethod
+    def process_resumes(cls, file_paths: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Union[str, Tuple[str, ...]]]]:
+        """
+        Process a batch of resume files in parallel worker processes.
         
-        if file_ext == '.pdf':
-            text = self.extract_text_from_pdf(file_path)
-        elif file_ext == '.docx':
-            text = self.extract_text_from_docx(file_path)
-        else:
+        Args:
+            file_paths: Paths to the resume files (PDF or DOCX)
+            max_workers: Worker process count (defaults to the CPU count)
+            
+        Returns:
+            One process_resume result per path, in the same order
+        """
+        # spawn, since callers may be threaded web workers; each worker builds its own matcher on import
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            return list(executor.map(_process_one, file_paths, chunksize=BATCH_CHUNKSIZE))
+
+    def process_resume_stream(self, file: Union[str, BinaryIO], file_ext: str) -> Dict[str, Union[str, Tuple[str, ...]]]:
+        """
+        Process a resume from a binary file object (or path) without touching disk.
+        
+        Args:
+            file: Open binary file object positioned at the start, e.g. an upload stream
+            file_ext: Extension identifying the format ('.pdf' or '.docx')
+            
+        Returns:
+            Dictionary with status, a preview of the cleaned text, and extracted skills
+        """
+        file_ext = file_ext.lower()
+        # Check the content too, so mislabeled files never reach the PDF/DOCX parsers
+        if file_ext not in ('.pdf', '.docx') or self._sniff(file) != file_ext:
             return {
                 "status": "error",
                 "message": "Unsupported file format. Please upload a PDF or DOCX file."
             }
         
-        if not text.strip():
+        key = self._result_key(file, file_ext)
+        if key is not None:
+            with self._result_cache_lock:
+                result = self._result_cache.get(key)
+                if result is not None:
+                    self._result_cache.move_to_end(key)
+                    return result
+        
+        result = self._extract_resume(file, file_ext)
+        
+        if key is not None:
+            with self._result_cache_lock:
+                self._result_cache[key] = result
+                if len(self._result_cache) > RESULT_CACHE_MAXSIZE:
+                    self._result_cache.popitem(last=False)
+        return result
+
+    def _sniff(self, file: Union[str, BinaryIO]) -> Optional[str]:
+        """Format ('.pdf' or '.docx') a file's first bytes identify, or None"""
+        try:
+            if isinstance(file, str):
+                with open(file, 'rb') as f:
+                    head = f.read(8)
+            else:
+                start = file.tell()
+                head = file.read(8)
+                file.seek(start)
+        except (OSError, ValueError, AttributeError):
+            logger.debug("Could not read resume header", exc_info=True)
+            return None
+        for signature, file_ext in FILE_SIGNATURES.items():
+            if head.startswith(signature):
+                return file_ext
+        return None
+
+    def _result_key(self, file: Union[str, BinaryIO], file_ext: str) -> Optional[tuple]:
+        """Cache key (blake2b digest, size, extension) for a resume, or None to skip caching"""
+        try:
+            if isinstance(file, str):
+                with open(file, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if not 0 < size <= RESULT_CACHE_MAX_FILE_SIZE:
+                        return None
+                    # Hash through a read-only mapping instead of reading the file into memory
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        digest = hashlib.blake2b(mapped).digest()
+            else:
+                start = file.tell()
+                hasher = hashlib.blake2b()
+                size = 0
+                while size <= RESULT_CACHE_MAX_FILE_SIZE:
+                    chunk = file.read(HASH_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    size += len(chunk)
+                file.seek(start)
+                if not 0 < size <= RESULT_CACHE_MAX_FILE_SIZE:
+                    return None
+                digest = hasher.digest()
+        except (OSError, ValueError, AttributeError):
+            logger.debug("Not caching resume result: file could not be hashed", exc_info=True)
+            return None
+        return digest, size, file_ext
+
+    def _extract_resume(self, file: Union[str, BinaryIO], file_ext: str) -> Dict[str, Union[str, Tuple[str, ...]]]:
+        """Extract the text preview and skills from a PDF or DOCX resume"""
+        # PDFs are read and scanned page by page, so the whole text is never held at once
+        if file_ext == '.pdf':
+            pages = self.iter_pdf_pages(file)
+        else:
+            pages = (self.extract_text_from_docx(file),)
+        
+        # Extract and normalize skills
+        preview = []
+        skills = self.extract_skills_streaming(pages, preview)
+        
+        if not preview:
             return {
                 "status": "error",
                 "message": "Unable to extract text from the file. The file might be empty or corrupted."
             }
         
-        # Extract and normalize skills
-        skills = self.extract_skills(text)
-        
         return {
             "status": "success",
-            "resume_text": text,
+            "resume_text": ' '.join(preview),
             "skills": skills
         }
+
+# Skill data is the same for every instance, so the matcher is built once at import
+ResumeProcessor._build_skill_matcher()
+
+@functools.lru_cache(maxsize=1)
+def _worker_processor() -> ResumeProcessor:
+    """ResumeProcessor for the current batch worker process"""
+    return ResumeProcessor()
+
+def _process_one(file_path: str) -> Dict[str, Union[str, Tuple[str, ...]]]:
+    """Process one resume in a batch worker (module-level so it pickles by name)"""
+    return _worker_processor().process_resume(file_path)
@@ -0,0 +1,111 @@
+import os
+import re
+
+import pytest
+
+pytest.importorskip("flask")
+# Keep the app on its in-memory store; no MySQL server is needed
+os.environ['DISABLE_MYSQL'] = '1'
+
+import app as app_module
+from app import app, generate_job_recommendations, render_skill_picker
+
+
+def titles(jobs):
+    return [job['title'] for job in jobs]
+
+
+def test_rank_jobs_orders_by_score():
+    jobs = generate_job_recommendations(['Python', 'Git'])
+    assert titles(jobs) == ['Python Developer', 'Data Scientist', 'Java Developer']
+    scores = [job['match_score'] for job in jobs]
+    assert scores == sorted(scores, reverse=True)
+    assert jobs[0]['matching_skills'] == ['Git', 'Python']
+
+
+def test_rank_jobs_keeps_ties_in_database_order():
+    jobs = generate_job_recommendations(['JavaScript'])
+    assert titles(jobs) == ['Java Full Stack Developer', 'Full Stack Developer', 'Frontend Developer']
+    assert jobs[1]['match_score'] == jobs[2]['match_score']
+    # The cut falls inside the tie; the earlier job wins
+    assert titles(generate_job_recommendations(['JavaScript'], top_k=2)) == titles(jobs)[:2]
+
+
+def test_rank_jobs_top_k_and_unknown_skills():
+    assert len(generate_job_recommendations(['Java'], top_k=3)) == 3
+    assert len(generate_job_recommendations(['Java'], top_k=10)) == 4
+    # Skill names are matched case- and whitespace-insensitively
+    assert generate_job_recommendations([' java ']) == generate_job_recommendations(['Java'])
+    assert generate_job_recommendations(['Underwater Basket Weaving']) == ()
+
+
+# The checkbox loop profile.html used before the picker was pre-rendered
+OLD_CHECKED = (
+    "{% for user_skill in user_skills %}"
+    "{% if user_skill[0] == skill and user_skill[1] == '__TYPE__' %}checked{% endif %}"
+    "{% endfor %}"
+)
+
+
+def render_old_skill_picker(user_skills):
+    source = app.jinja_loader.get_source(app.jinja_env, '_skill_picker.html')[0]
+    it_section, non_it_section = source.split('<!-- Non-IT Skills Section -->')
+    source = (
+        it_section.replace('{{ checked }}', OLD_CHECKED.replace('__TYPE__', 'IT'))
+        + '<!-- Non-IT Skills Section -->'
+        + non_it_section.replace('{{ checked }}', OLD_CHECKED.replace('__TYPE__', 'Non-IT'))
+    )
+    return app.jinja_env.from_string(source).render(
+        it_skills=app_module.IT_SKILLS, non_it_skills=app_module.NON_IT_SKILLS, user_skills=user_skills,
+    )
+
+
+@pytest.mark.parametrize('user_skills', [
+    [],
+    [('Python', 'IT', 'Advanced'), ('Docker', 'IT', 'Beginner'), ('Leadership', 'Non-IT', 'Intermediate')],
+    # A skill saved under the other type stays unchecked
+    [('Python', 'Non-IT', 'Beginner'), ('Not In The Catalog', 'IT', 'Beginner')],
+])
+def test_skill_picker_matches_old_template(user_skills):
+    with app.test_request_context():
+        html = str(render_skill_picker(user_skills))
+        old_html = render_old_skill_picker(user_skills)
+    # Only whitespace inside the <input> tags differs
+    assert ' '.join(html.split()) == ' '.join(old_html.split())
+    assert len(re.findall(r'\bchecked>', html)) == sum(
+        1 for skill, skill_type, _ in user_skills if (skill, skill_type) in app_module.SKILL_PICKER_SLOTS
+    )
+
+
+@pytest.fixture
+def client():
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+    return client
+
+
+@pytest.mark.parametrize('body', [
+    None,
+    [],
+    {'names': ['Python']},
+    {'skills': 'Python'},
+    {'skills': ['Python', 3]},
+    {'skills': [['Python']]},
+    {'skills': ['Skill %d' % i for i in range(app_module.MAX_SKILLS_PER_SAVE + 1)]},
+])
+def test_save_skills_rejects_bad_bodies(client, body):
+    response = client.post('/api/save-skills', json=body)
+    assert response.status_code == 400
+    assert response.get_json()['status'] == 'error'
+
+
+def test_save_skills_normalizes_names(client, monkeypatch):
+    monkeypatch.setattr(app_module, 'user_skills_db', {})
+    # Blank names and repeats don't count towards the limit
+    skills = ['python', ' Python ', '   ', ''] + ['Skill %d' % i for i in range(app_module.MAX_SKILLS_PER_SAVE - 1)]
+    response = client.post('/api/save-skills', json={'skills': skills})
+    assert response.status_code == 200
+    saved = [skill for skill, _, _ in app_module.user_skills_db[1]]
+    assert saved[0] == 'Python'
+    assert len(saved) == app_module.MAX_SKILLS_PER_SAVE
@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("aiohttp")
+
+import hiring_companies_analyzer
+from hiring_companies_analyzer import HiringCompaniesAnalyzer, JobPosting
+
+
+def posting(title, location="Pune", platform="LinkedIn"):
+    return JobPosting("Acme", title, location, "today", f"https://jobs.example/{platform}", platform)
+
+
+def test_deduplicate_jobs_drops_exact_repeats(monkeypatch):
+    # Exact repeats are caught without scikit-learn
+    monkeypatch.setattr(hiring_companies_analyzer, 'SKLEARN_AVAILABLE', False)
+    jobs = [
+        posting("Python Developer"),
+        posting("python developer", "pune", platform="Indeed"),
+        posting("Python Developer", "Mumbai"),
+    ]
+    unique = HiringCompaniesAnalyzer().deduplicate_jobs(jobs)
+    assert [(job.title, job.location, job.platform) for job in unique] == [
+        ("Python Developer", "Pune", "LinkedIn"),
+        ("Python Developer", "Mumbai", "LinkedIn"),
+    ]
+
+
+def test_deduplicate_jobs_drops_near_duplicates():
+    pytest.importorskip("sklearn")
+    jobs = [
+        posting("Senior Python Developer", "Bangalore"),
+        posting("Senior  Python Developer ", "Bangalore", platform="Glassdoor"),
+        posting("Senior Python Developer (Remote)", "Bangalore"),
+        posting("C++ Developer"),
+        posting("C# Developer"),
+    ]
+    unique = HiringCompaniesAnalyzer().deduplicate_jobs(jobs)
+    assert [job.title for job in unique] == [
+        "Senior Python Developer", "Senior Python Developer (Remote)", "C++ Developer", "C# Developer",
+    ]
@@ -0,0 +1,123 @@
+import io
+
+import pytest
+
+docx = pytest.importorskip("docx")
+pytest.importorskip("pypdf")
+
+import resume_processor
+from resume_processor import ResumeProcessor
+
+
+def test_docx_tabs_and_breaks_separate_words(tmp_path):
+    document = docx.Document()
+    paragraph = document.add_paragraph()
+    run = paragraph.add_run("Python")
+    run.add_tab()
+    run.add_text("Java")
+    run.add_break()
+    run.add_text("Docker")
+    run = paragraph.add_run()
+    run.add_break()
+    run.add_text("Kubernetes")
+    path = tmp_path / "resume.docx"
+    document.save(path)
+
+    processor = ResumeProcessor()
+    text = processor.extract_text_from_docx(str(path))
+
+    assert text.strip() == docx.Document(path).paragraphs[0].text
+    assert "Python\tJava\nDocker\nKubernetes" in text
+    assert processor.process_resume(str(path))["skills"] == ("Docker", "Java", "Kubernetes", "Python")
+
+
+BACKENDS = {
+    'hyperscan': (True, True),
+    'ahocorasick': (False, True),
+    'regex': (False, False),
+}
+
+# Punctuated skills, overlapping phrases, glued words and non-ASCII neighbours
+SKILL_FIXTURE = (
+    "Senior React Native dev. •Python•, Django & Spring Boot; AWS/GCP, C++ and C#. "
+    "ASP.NET Core, .net core, node.js, vue.js, scikit-learn. reactive pythonic éreact reactü "
+    "react_native spring boot react"
+)
+
+
+@pytest.fixture
+def use_backend(monkeypatch):
+    """Rebuild the shared skill matcher for one backend, restoring the default afterwards"""
+    def use(name):
+        use_hyperscan, use_ahocorasick = BACKENDS[name]
+        if use_hyperscan and not resume_processor.HYPERSCAN_AVAILABLE:
+            pytest.skip("hyperscan not installed")
+        if use_ahocorasick and not resume_processor.AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick not installed")
+        monkeypatch.setattr(resume_processor, 'HYPERSCAN_AVAILABLE', use_hyperscan)
+        monkeypatch.setattr(resume_processor, 'AHOCORASICK_AVAILABLE', use_ahocorasick)
+        ResumeProcessor._build_skill_matcher()
+    yield use
+    monkeypatch.undo()
+    ResumeProcessor._build_skill_matcher()
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_skill_backends_agree(use_backend, backend):
+    use_backend(backend)
+    assert ResumeProcessor().extract_skills(SKILL_FIXTURE) == (
+        '.net Core', 'Amazon Web Services', 'Asp.net Core', 'Django', 'Google Cloud', 'Node.js',
+        'Python', 'React', 'React Native', 'Scikit-Learn', 'Spring Boot', 'Vue', 'c#', 'c++',
+    )
+
+
+def test_streaming_finds_skills_split_across_pages():
+    pages = ["Built services on Amazon", "Web", "Services with Spring", "", "Boot and Docker"]
+    skills = ResumeProcessor().extract_skills_streaming(pages)
+    assert {'Amazon Web Services', 'Spring Boot', 'Docker'} <= set(skills)
+
+
+def docx_bytes(*paragraphs):
+    document = docx.Document()
+    for text in paragraphs:
+        document.add_paragraph(text)
+    stream = io.BytesIO()
+    document.save(stream)
+    return stream.getvalue()
+
+
+@pytest.fixture
+def counted_processor(monkeypatch):
+    """A processor that records how many times it actually parses a file"""
+    processor = ResumeProcessor()
+    calls = []
+    extract = processor._extract_resume
+    monkeypatch.setattr(processor, '_extract_resume', lambda *args: calls.append(args) or extract(*args))
+    return processor, calls
+
+
+def test_same_bytes_hit_the_result_cache(counted_processor):
+    processor, calls = counted_processor
+    data = docx_bytes("Python and Docker")
+    first = processor.process_resume_stream(io.BytesIO(data), '.docx')
+    second = processor.process_resume_stream(io.BytesIO(data), '.DOCX')
+    assert first["skills"] == ("Docker", "Python")
+    assert second == first
+    assert len(calls) == 1
+    # Different content is parsed again
+    processor.process_resume_stream(io.BytesIO(docx_bytes("Java")), '.docx')
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize('data, file_ext', [
+    (docx_bytes("Python"), '.pdf'),
+    (b'%PDF-1.4 not really a docx', '.docx'),
+    (b'plain text resume with Python', '.pdf'),
+    (b'', '.pdf'),
+    (docx_bytes("Python"), '.txt'),
+])
+def test_mislabeled_files_are_rejected(counted_processor, data, file_ext):
+    processor, calls = counted_processor
+    result = processor.process_resume_stream(io.BytesIO(data), file_ext)
+    assert result["status"] == "error"
+    assert calls == []